@@ -0,0 +1,627 @@
+# Author: agent
+# GitHub username: agent
+# Date: 10/18/2026
+# Description: A computer player for the checkers game. Searches the moves from Checkers.legal_moves with negamax and
+#   alpha-beta pruning, deepening one ply at a time until its time budget runs out, and returns the best move it
+#   found along with how many positions it searched per second. Positions it has already searched are remembered in
+#   a fixed-size transposition table keyed by Checkers.position_hash. parallel_best_move runs the same search in
+#   several processes at once that share one transposition table in shared memory, and ParallelSearcher keeps
+#   those processes and the table alive from one search to the next.
+
+import collections
+import concurrent.futures
+import multiprocessing
+import os
+import time
+from multiprocessing import shared_memory
+
+from checkers_game import Checkers
+
+
+# How much each piece is worth to the evaluation
+MAN_VALUE = 100
+KING_VALUE = 160
+TRIPLE_KING_VALUE = 220
+
+# Score for a side that has no moves left. Wins found sooner score slightly higher than wins found later.
+WIN_SCORE = 100000
+
+# Scores this close to WIN_SCORE are wins or losses rather than material counts
+_WIN_RANGE = 1000
+
+# The clock is only checked once every this many positions, so reading it stays a tiny share of the search time
+_CLOCK_CHECK_INTERVAL = 16
+
+
+# Kinds of score a transposition table entry can hold: the exact score, or only a lower or upper bound on it when
+#   the search of that position was cut off by alpha-beta.
+EXACT = 1
+LOWER_BOUND = 2
+UPPER_BOUND = 3
+
+# Memory the search's transposition table gets when the caller doesn't pass one in
+DEFAULT_TABLE_MB = 4
+
+# Positions an EvaluationCache remembers when the caller doesn't say
+DEFAULT_CACHE_SIZE = 10000
+
+# Each entry is two 64-bit words: the position hash XORed with the data, and the data packed as score (bits 0-31,
+#   offset so it is never negative), depth (bits 32-39), bound (bits 40-41, 0 for an empty slot) and best move number
+#   + 1 (bits 42-49).
+_ENTRY_BYTES = 16
+_SCORE_OFFSET = 1 << 31
+
+
+def transposition_table_bytes(size_mb=DEFAULT_TABLE_MB):
+    """Returns how many bytes a TranspositionTable of size_mb uses: the largest power of two number of buckets that
+        fits, so a bucket can be found with a bit mask"""
+    bucket_count = 1
+    while bucket_count * 4 * _ENTRY_BYTES <= size_mb * 1024 * 1024:
+        bucket_count *= 2
+    return bucket_count * 2 * _ENTRY_BYTES
+
+
+class TranspositionTable:
+    """A fixed-size table of search results keyed by position hash. Positions map to buckets of two entries: the first
+        keeps whichever result was searched deepest, and the second always takes the newest result, so deep results
+        survive while recent ones are still found. It never grows past the memory it was given.
+
+        The table can also be laid over a buffer it is given, such as shared memory, so processes searching at the
+        same time share what they find. Each entry's first word is the position hash XORed with its data, so an entry
+        half written by another process doesn't match any position and is never used."""
+
+    def __init__(self, size_mb=DEFAULT_TABLE_MB, buffer=None):
+        if buffer is None:
+            buffer = bytearray(transposition_table_bytes(size_mb))
+        self._words = memoryview(buffer).cast("Q")
+        self._bucket_mask = len(self._words) // 4 - 1
+        self._hits = 0
+        self._misses = 0
+        self._collisions = 0
+
+    def get_size(self):
+        """Get how many entries the table can hold"""
+        return len(self._words) // 2
+
+    def get_hits(self):
+        """Get how many lookups found their position"""
+        return self._hits
+
+    def get_misses(self):
+        """Get how many lookups did not find their position"""
+        return self._misses
+
+    def get_collisions(self):
+        """Get how many lookups missed because their bucket was holding other positions"""
+        return self._collisions
+
+    def get_hit_rate(self):
+        """Get the share of lookups that found their position"""
+        lookups = self._hits + self._misses
+        if lookups == 0:
+            return 0
+        return self._hits / lookups
+
+    def clear(self):
+        """Empty the table and reset its counters"""
+        self._words[:] = memoryview(bytes(len(self._words) * 8)).cast("Q")
+        self._hits = 0
+        self._misses = 0
+        self._collisions = 0
+
+    def release(self):
+        """Let go of the table's buffer, which has to happen before shared memory it is laid over can be closed"""
+        self._words.release()
+
+    def lookup(self, position_hash):
+        """Returns (depth, score, bound, move number) for the position, or None if the table doesn't have it. The
+            move number is whatever was stored with it, or None."""
+        words = self._words
+        index = (position_hash & self._bucket_mask) * 4
+        for slot in (index, index + 2):
+            data = words[slot + 1]
+            if data and words[slot] ^ data == position_hash:
+                self._hits += 1
+                move = (data >> 42) & 0xFF
+                return ((data >> 32) & 0xFF, (data & 0xFFFFFFFF) - _SCORE_OFFSET, (data >> 40) & 0x3,
+                        move - 1 if move else None)
+
+        self._misses += 1
+        if words[index + 1] or words[index + 3]:
+            self._collisions += 1
+        return None
+
+    def store(self, position_hash, depth, score, bound, move=None):
+        """Stores a search result. move is the number of the best move in the position's move list, up to 254, or
+            None. Depth is capped at 255."""
+        words = self._words
+        index = (position_hash & self._bucket_mask) * 4
+        depth = min(depth, 0xFF)
+        data = (score + _SCORE_OFFSET) | depth << 32 | bound << 40 | (0 if move is None else move + 1) << 42
+
+        # The first entry is replaced by deeper (or equally deep) results, or by the same position. Whatever it was
+        #   holding moves down to the always-replace entry instead of being thrown away.
+        first_hash = words[index] ^ words[index + 1]
+        if not words[index + 1] or first_hash == position_hash or depth >= (words[index + 1] >> 32) & 0xFF:
+            if words[index + 1] and first_hash != position_hash:
+                words[index + 2] = words[index]
+                words[index + 3] = words[index + 1]
+            elif words[index + 2] ^ words[index + 3] == position_hash:
+                words[index + 3] = 0
+            words[index] = position_hash ^ data
+            words[index + 1] = data
+        else:
+            words[index + 2] = position_hash ^ data
+            words[index + 3] = data
+
+
+class EvaluationCache:
+    """Remembers the evaluations of the positions most recently asked about, keyed by the board from
+        Checkers.get_board() and the side to move, so asking about a position again skips evaluating it. Once it holds
+        capacity positions, the one used least recently is thrown out to make room. The evaluator is called as
+        evaluator(game) on a miss; by default it is evaluate() for the side to move."""
+
+    def __init__(self, evaluator=None, capacity=DEFAULT_CACHE_SIZE):
+        self._evaluator = evaluator
+        self._capacity = capacity
+        self._entries = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get_capacity(self):
+        """Get how many positions the cache can hold"""
+        return self._capacity
+
+    def get_size(self):
+        """Get how many positions the cache is holding"""
+        return len(self._entries)
+
+    def get_hits(self):
+        """Get how many evaluations were answered from the cache"""
+        return self._hits
+
+    def get_misses(self):
+        """Get how many evaluations had to be worked out"""
+        return self._misses
+
+    def get_hit_rate(self):
+        """Get the share of evaluations answered from the cache"""
+        lookups = self._hits + self._misses
+        if lookups == 0:
+            return 0
+        return self._hits / lookups
+
+    def clear(self):
+        """Empty the cache and reset its counters"""
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def evaluate(self, game):
+        """Returns the evaluation of the game's current position, from the cache if it is there"""
+        color = side_to_move(game)
+        key = (game.get_board().get_key(), color)
+        entries = self._entries
+        if key in entries:
+            self._hits += 1
+            entries.move_to_end(key)
+            return entries[key]
+
+        self._misses += 1
+        if self._evaluator is None:
+            value = evaluate(game, color)
+        else:
+            value = self._evaluator(game)
+        entries[key] = value
+        if len(entries) > self._capacity:
+            entries.popitem(last=False)
+        return value
+
+
+class _SearchTimeout(Exception):
+    """Raised inside the search when the time budget runs out"""
+    pass
+
+
+class SearchResult:
+    """The move best_move picked, and how the search went"""
+
+    def __init__(self, move, score, depth, nodes, elapsed_time):
+        self._move = move
+        self._score = score
+        self._depth = depth
+        self._nodes = nodes
+        self._elapsed_time = elapsed_time
+
+    def get_move(self):
+        """Get the best move, as a tuple of square locations, or None if the side to move has no moves"""
+        return self._move
+
+    def get_score(self):
+        """Get the score of the best move from the point of view of the side to move"""
+        return self._score
+
+    def get_depth(self):
+        """Get the deepest search (in plies) that finished before time ran out"""
+        return self._depth
+
+    def get_nodes(self):
+        """Get how many positions were searched"""
+        return self._nodes
+
+    def get_elapsed_time(self):
+        """Get how long the search took, in seconds"""
+        return self._elapsed_time
+
+    def get_nodes_per_second(self):
+        """Get how many positions were searched per second"""
+        if self._elapsed_time <= 0:
+            return 0
+        return self._nodes / self._elapsed_time
+
+
+def side_to_move(game):
+    """Returns the color whose turn it is in the game. Black goes first, so it is black's turn whenever black has
+        played as many turns as white."""
+    if game.get_black_turn() <= game.get_white_turn():
+        return "Black"
+    return "White"
+
+
+def evaluate(game, color):
+    """Scores the position from the point of view of the color given, by counting material. Kings are worth more than
+        men, and triple kings more than kings."""
+    black_pieces, white_pieces, kings, triple_kings = game.get_bitboards()
+    men = ~(kings | triple_kings)
+    black_score = (black_pieces & men).bit_count() * MAN_VALUE + (black_pieces & kings).bit_count() * KING_VALUE + \
+        (black_pieces & triple_kings).bit_count() * TRIPLE_KING_VALUE
+    white_score = (white_pieces & men).bit_count() * MAN_VALUE + (white_pieces & kings).bit_count() * KING_VALUE + \
+        (white_pieces & triple_kings).bit_count() * TRIPLE_KING_VALUE
+
+    if color == "Black":
+        return black_score - white_score
+    return white_score - black_score
+
+
+def _is_capture(move):
+    """Check if a move jumps over a piece"""
+    return move[1][0] - move[0][0] in (-2, 2)
+
+
+def _score_to_table(score, ply):
+    """Win and loss scores count plies from the root, so they are stored counting from the position itself instead,
+        which stays right wherever in the tree the position turns up again"""
+    if score > WIN_SCORE - _WIN_RANGE:
+        return score + ply
+    if score < -WIN_SCORE + _WIN_RANGE:
+        return score - ply
+    return score
+
+
+def _score_from_table(score, ply):
+    """Turns a score read from the transposition table back into one counted from the root"""
+    if score > WIN_SCORE - _WIN_RANGE:
+        return score - ply
+    if score < -WIN_SCORE + _WIN_RANGE:
+        return score + ply
+    return score
+
+
+def _order_moves(moves):
+    """Sorts moves so the ones that capture the most pieces are searched first"""
+    moves.sort(key=len, reverse=True)
+    return moves
+
+
+class _Search:
+    """One search through a game's positions, with a deadline it cannot run past"""
+
+    def __init__(self, game, deadline, transposition_table, stop_flag=None):
+        self._game = game
+        self._deadline = deadline
+        self._table = transposition_table
+        self._stop_flag = stop_flag
+        self._nodes = 0
+
+    def get_nodes(self):
+        """Get how many positions have been searched so far"""
+        return self._nodes
+
+    def root(self, color, moves, depth):
+        """Searches each move from the root position and returns (score, best move)"""
+        enemy = "White" if color == "Black" else "Black"
+        alpha = -WIN_SCORE - 1
+        best_move = moves[0]
+        for move in moves:
+            self._game.make_move(move)
+            try:
+                score = -self.negamax(enemy, depth - 1, 1, -WIN_SCORE - 1, -alpha)
+            finally:
+                self._game.unmake_move()
+            if score > alpha:
+                alpha = score
+                best_move = move
+        return alpha, best_move
+
+    def negamax(self, color, depth, ply, alpha, beta):
+        """Returns the score of the position for the color to move, searched depth plies deep"""
+        self._nodes += 1
+        if self._nodes % _CLOCK_CHECK_INTERVAL == 0 and \
+                (time.perf_counter() >= self._deadline or self._stop_flag is not None and self._stop_flag[0]):
+            raise _SearchTimeout
+
+        game = self._game
+        if depth <= 0:
+            # Don't stop in the middle of an exchange: keep going while the side to move has a capture
+            first_move = next(game.legal_moves(color), None)
+            if first_move is None:
+                return -WIN_SCORE + ply
+            if not _is_capture(first_move):
+                return evaluate(game, color)
+            depth = 1
+
+        moves = _order_moves(list(game.legal_moves(color)))
+        if not moves:
+            return -WIN_SCORE + ply
+
+        # Use what the transposition table knows: a deep enough result can end the search here, and otherwise the
+        #   best move it found last time is searched first
+        table = self._table
+        position_hash = game.position_hash()
+        order = range(len(moves))
+        entry = table.lookup(position_hash)
+        if entry is not None:
+            entry_depth, entry_score, bound, move_number = entry
+            if entry_depth >= depth:
+                entry_score = _score_from_table(entry_score, ply)
+                if bound == EXACT or bound == LOWER_BOUND and entry_score >= beta or \
+                        bound == UPPER_BOUND and entry_score <= alpha:
+                    return entry_score
+            if move_number is not None and 0 < move_number < len(moves):
+                order = [move_number] + [number for number in order if number != move_number]
+
+        original_alpha = alpha
+        best_score = -WIN_SCORE - 1
+        best_number = 0
+        enemy = "White" if color == "Black" else "Black"
+        for number in order:
+            game.make_move(moves[number])
+            try:
+                score = -self.negamax(enemy, depth - 1, ply + 1, -beta, -alpha)
+            finally:
+                game.unmake_move()
+            if score > best_score:
+                best_score = score
+                best_number = number
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if best_score >= beta:
+            bound = LOWER_BOUND
+        elif best_score <= original_alpha:
+            bound = UPPER_BOUND
+        else:
+            bound = EXACT
+        table.store(position_hash, depth, _score_to_table(best_score, ply), bound,
+                    best_number if best_number < 0xFF else None)
+        return best_score
+
+
+def best_move(game, time_ms, max_depth=64, transposition_table=None):
+    """Searches the position for the side to move, deepening one ply at a time until time_ms milliseconds have
+        passed or max_depth is reached, and returns a SearchResult with the best move from the deepest finished
+        search. The game is left exactly as it was. Pass in a TranspositionTable to keep what was learned from one
+        search to the next; otherwise a new DEFAULT_TABLE_MB table is used."""
+    started = time.perf_counter()
+    color = side_to_move(game)
+    moves = _order_moves(list(game.legal_moves(color)))
+    if not moves:
+        return SearchResult(None, -WIN_SCORE, 0, 0, time.perf_counter() - started)
+
+    # With only one move there is nothing to search
+    if len(moves) == 1:
+        return SearchResult(moves[0], evaluate(game, color), 0, 0, time.perf_counter() - started)
+
+    if transposition_table is None:
+        transposition_table = TranspositionTable()
+    search = _Search(game, started + time_ms / 1000, transposition_table)
+    move, score, depth = _deepen(search, game, color, moves, 1, max_depth)
+    return SearchResult(move, score, depth, search.get_nodes(), time.perf_counter() - started)
+
+
+def _deepen(search, game, color, moves, first_depth, max_depth):
+    """Runs the search one ply deeper at a time from first_depth until it times out or reaches max_depth, and returns
+        (best move, score, depth) from the deepest search that finished"""
+    move, score, depth = moves[0], evaluate(game, color), 0
+    for next_depth in range(first_depth, max_depth + 1):
+        try:
+            next_score, next_move = search.root(color, moves, next_depth)
+        except _SearchTimeout:
+            break
+
+        move, score, depth = next_move, next_score, next_depth
+        # Search the best move first next time, so the deeper search cuts off more
+        moves.remove(move)
+        moves.insert(0, move)
+        # Stop early once a win or loss has been found
+        if abs(score) >= WIN_SCORE - max_depth:
+            break
+    return move, score, depth
+
+
+class ParallelSearchResult(SearchResult):
+    """The move parallel_best_move picked, with how each worker process did"""
+
+    def __init__(self, move, score, depth, nodes, elapsed_time, worker_stats):
+        super().__init__(move, score, depth, nodes, elapsed_time)
+        self._worker_stats = worker_stats
+
+    def get_workers(self):
+        """Get how many worker processes searched"""
+        return len(self._worker_stats)
+
+    def get_worker_depths(self):
+        """Get the deepest search each worker finished, in worker order"""
+        return [depth for nodes, elapsed_time, depth in self._worker_stats]
+
+    def get_worker_nodes_per_second(self):
+        """Get how many positions per second each worker searched, in worker order"""
+        return [nodes / elapsed_time if elapsed_time > 0 else 0 for nodes, elapsed_time, depth in self._worker_stats]
+
+    def get_speedup(self, serial_result):
+        """Get how many times faster this search reached its depth than a single process search (a SearchResult from
+            best_move) that reached the same depth"""
+        if serial_result.get_depth() != self.get_depth():
+            raise ValueError("Speedup can only be measured between searches that reached the same depth")
+        if self.get_elapsed_time() <= 0:
+            return 0
+        return serial_result.get_elapsed_time() / self.get_elapsed_time()
+
+
+# How many milliseconds before a parallel search's time is up its workers stop, to leave time for their results to be
+#   sent back and compared
+_PARALLEL_RESULT_MARGIN_MS = 10
+
+# Each ParallelSearcher worker process attaches to the shared table and stop flag once, when it starts, and keeps them
+#   for every search it runs
+_worker_shared = None
+_worker_table = None
+_worker_stop_flag = None
+_worker_barrier = None
+
+
+def _start_search_worker(shared_name, table_bytes, barrier):
+    """Worker side of ParallelSearcher: attaches to the shared memory when the worker process starts"""
+    global _worker_shared, _worker_table, _worker_stop_flag, _worker_barrier
+    _worker_shared = shared_memory.SharedMemory(shared_name)
+    _worker_table = TranspositionTable(buffer=_worker_shared.buf[:table_bytes])
+    _worker_stop_flag = _worker_shared.buf[table_bytes:table_bytes + 1]
+    _worker_barrier = barrier
+
+
+def _search_worker_ready():
+    """Worker side of ParallelSearcher: waits until every worker has started. No worker can take a second one of these
+        while it waits, so running one per worker means every process is up and attached."""
+    _worker_barrier.wait()
+
+
+def _search_worker(bitboards, black_to_move, end_time, max_depth, worker_number):
+    """Worker side of ParallelSearcher.search: searches the position with the shared transposition table and returns
+        (move, score, depth, nodes, elapsed time). Worker 0 searches the usual way and tells the others to stop when
+        it finishes. The others start at different depths and with the first moves in different orders, so they
+        fill the table with different parts of the tree for worker 0 to pick up."""
+    started = time.perf_counter()
+    game = Checkers()
+    game.set_bitboards(*bitboards, black_to_move)
+    color = side_to_move(game)
+    moves = _order_moves(list(game.legal_moves(color)))
+    shift = worker_number % len(moves)
+    moves = moves[shift:] + moves[:shift]
+
+    # end_time is wall clock time, since each process has its own performance counter
+    search = _Search(game, started + end_time - time.time(), _worker_table, _worker_stop_flag)
+    move, score, depth = _deepen(search, game, color, moves, 1 + worker_number % 2, max_depth)
+    if worker_number == 0:
+        _worker_stop_flag[0] = 1
+    return move, score, depth, search.get_nodes(), time.perf_counter() - started
+
+
+class ParallelSearcher:
+    """Searches positions across workers worker processes (the number of CPUs by default) that share one
+        transposition table of table_mb in shared memory (lazy SMP). The processes and the table are set up once and
+        kept between searches, so a search's time budget goes on searching rather than starting processes, and each
+        search starts from what the last ones learned. Call close, or use it in a with statement, when done."""
+
+    def __init__(self, workers=None, table_mb=DEFAULT_TABLE_MB):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self._workers = workers
+        # The table, then one byte that worker 0 sets to tell the others to stop
+        self._table_bytes = transposition_table_bytes(table_mb)
+        self._shared = shared_memory.SharedMemory(create=True, size=self._table_bytes + 1)
+        try:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers, initializer=_start_search_worker,
+                initargs=(self._shared.name, self._table_bytes, multiprocessing.Barrier(workers)))
+            # The pool only starts a process when work is waiting for one, so give every worker something to do now
+            for future in [self._executor.submit(_search_worker_ready) for worker_number in range(workers)]:
+                future.result()
+        except BaseException:
+            self._shared.close()
+            self._shared.unlink()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+    def get_workers(self):
+        """Get how many worker processes search"""
+        return self._workers
+
+    def search(self, game, time_ms, max_depth=64):
+        """Searches the position for the side to move like best_move, finishing within time_ms milliseconds, and
+            returns a ParallelSearchResult with the move from the deepest search any worker finished, preferring
+            worker 0's on a tie, and each worker's depth and nodes per second. The game is left exactly as it was."""
+        started = time.perf_counter()
+        color = side_to_move(game)
+        moves = list(game.legal_moves(color))
+        if len(moves) <= 1:
+            return _single_process_result(best_move(game, time_ms, max_depth))
+
+        self._shared.buf[self._table_bytes] = 0
+        # Workers stop a little early so their results can come back before time_ms is up
+        end_time = time.time() + (time_ms - _PARALLEL_RESULT_MARGIN_MS) / 1000 - (time.perf_counter() - started)
+        futures = [self._executor.submit(_search_worker, game.get_bitboards(), color == "Black", end_time, max_depth,
+                                         worker_number)
+                   for worker_number in range(self._workers)]
+        results = [future.result() for future in futures]
+
+        move, score, depth = results[0][:3]
+        for worker_move, worker_score, worker_depth, nodes, elapsed_time in results[1:]:
+            if worker_depth > depth:
+                move, score, depth = worker_move, worker_score, worker_depth
+        return ParallelSearchResult(move, score, depth, sum(result[3] for result in results),
+                                    time.perf_counter() - started, [result[3:] + result[2:3] for result in results])
+
+    def close(self):
+        """Stop the worker processes and free the shared table. The workers are idle between searches, so they are
+            left to exit on their own rather than waited for."""
+        self._executor.shutdown(wait=False)
+        self._shared.close()
+        self._shared.unlink()
+
+
+def _single_process_result(result):
+    """Turns a SearchResult from best_move into a ParallelSearchResult with one worker"""
+    return ParallelSearchResult(result.get_move(), result.get_score(), result.get_depth(), result.get_nodes(),
+                                result.get_elapsed_time(),
+                                [(result.get_nodes(), result.get_elapsed_time(), result.get_depth())])
+
+
+def parallel_best_move(game, time_ms, workers=None, max_depth=64, table_mb=DEFAULT_TABLE_MB):
+    """Runs one ParallelSearcher search and shuts the searcher down again, all within time_ms milliseconds. Starting
+        the worker processes comes out of that budget, and if it leaves too little for the workers, what is left is
+        spent searching in this process instead. Anything searching more than one position should keep a
+        ParallelSearcher rather than paying for the start up every time."""
+    started = time.perf_counter()
+    with ParallelSearcher(workers, table_mb) as searcher:
+        time_left = time_ms - (time.perf_counter() - started) * 1000
+        if time_left > 2 * _PARALLEL_RESULT_MARGIN_MS:
+            return searcher.search(game, time_left, max_depth)
+    return _single_process_result(best_move(game, max(0, time_ms - (time.perf_counter() - started) * 1000),
+                                            max_depth))
+
+
+def measure_speedup(game, depth, workers=None):
+    """Searches the position to a fixed depth once in this process and once with a ParallelSearcher, whose workers
+        are started before the search is timed, and returns the parallel result and its speedup over the single
+        process search"""
+    serial_result = best_move(game, 10 ** 9, max_depth=depth)
+    with ParallelSearcher(workers) as searcher:
+        parallel_result = searcher.search(game, 10 ** 9, max_depth=depth)
+    return parallel_result, parallel_result.get_speedup(serial_result)
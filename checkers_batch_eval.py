@@ -0,0 +1,115 @@
+# Author: agent
+# GitHub username: agent
+# Date: 10/18/2026
+# Description: Scores many checkers positions at once with NumPy. Positions are packed into an N x 4 array of their
+#   bitboards (black pieces, white pieces, kings, triple kings), and piece counts, captured counts, mobility and
+#   material scores for all N come out of a handful of whole-array operations instead of a Python loop per board.
+
+import numpy as np
+
+from checkers_ai import KING_VALUE
+from checkers_ai import MAN_VALUE
+from checkers_ai import TRIPLE_KING_VALUE
+
+
+# Columns of a packed positions array
+BLACK_PIECES = 0
+WHITE_PIECES = 1
+KINGS = 2
+TRIPLE_KINGS = 3
+
+# Dark squares on even rows (0, 2, 4, 6) and odd rows (1, 3, 5, 7) as bitboards, and the squares on the left and
+#   right edges of the board. Moving one row up or down shifts a bit by 3, 4 or 5 depending on the row and direction.
+_EVEN_ROWS = np.uint32(0x0F0F0F0F)
+_ODD_ROWS = np.uint32(0xF0F0F0F0)
+_LEFT_EDGE = np.uint32(0x10101010)
+_RIGHT_EDGE = np.uint32(0x08080808)
+
+
+def pack_positions(games):
+    """Packs the positions of the games given (Checkers objects, or anything else with get_bitboards) into an N x 4
+        array of uint32 bitboards"""
+    return np.array([game.get_bitboards() for game in games], dtype=np.uint32).reshape(-1, 4)
+
+
+def popcount(bitboards):
+    """Counts the set bits in every element of a uint32 array"""
+    bitboards = bitboards - ((bitboards >> np.uint32(1)) & np.uint32(0x55555555))
+    bitboards = (bitboards & np.uint32(0x33333333)) + ((bitboards >> np.uint32(2)) & np.uint32(0x33333333))
+    bitboards = (bitboards + (bitboards >> np.uint32(4))) & np.uint32(0x0F0F0F0F)
+    return ((bitboards * np.uint32(0x01010101)) >> np.uint32(24)).astype(np.int32)
+
+
+def _step_up_left(bitboards):
+    """Moves every bit one square toward row 0 and column 0"""
+    return ((bitboards & _EVEN_ROWS) >> np.uint32(4)) | ((bitboards & _ODD_ROWS & ~_LEFT_EDGE) >> np.uint32(5))
+
+
+def _step_up_right(bitboards):
+    """Moves every bit one square toward row 0 and column 7"""
+    return ((bitboards & _EVEN_ROWS & ~_RIGHT_EDGE) >> np.uint32(3)) | ((bitboards & _ODD_ROWS) >> np.uint32(4))
+
+
+def _step_down_left(bitboards):
+    """Moves every bit one square toward row 7 and column 0"""
+    return ((bitboards & _EVEN_ROWS) << np.uint32(4)) | ((bitboards & _ODD_ROWS & ~_LEFT_EDGE) << np.uint32(3))
+
+
+def _step_down_right(bitboards):
+    """Moves every bit one square toward row 7 and column 7"""
+    return ((bitboards & _EVEN_ROWS & ~_RIGHT_EDGE) << np.uint32(5)) | ((bitboards & _ODD_ROWS) << np.uint32(4))
+
+
+def _mobility(forward_steps, backward_steps, own_pieces, enemy_pieces, kings, empty_squares):
+    """Counts the moves for one side in every position: the jumps it can start if it has any (since captures are
+        forced), otherwise its single steps. Each jump is counted once however many more jumps could follow it."""
+    steps = np.zeros(own_pieces.shape, dtype=np.int32)
+    jumps = np.zeros(own_pieces.shape, dtype=np.int32)
+    for step, pieces in ((forward_steps[0], own_pieces), (forward_steps[1], own_pieces),
+                         (backward_steps[0], own_pieces & kings), (backward_steps[1], own_pieces & kings)):
+        steps += popcount(step(pieces) & empty_squares)
+        jumps += popcount(step(step(pieces) & enemy_pieces) & empty_squares)
+    return np.where(jumps > 0, jumps, steps)
+
+
+def batch_features(positions):
+    """Works out the features of every position in an N x 4 packed positions array, returned as a dict of length-N
+        arrays. The counts match what Player.get_king_count, get_triple_king_count and get_captured_pieces_count
+        give for the same board."""
+    black_pieces = positions[:, BLACK_PIECES]
+    white_pieces = positions[:, WHITE_PIECES]
+    kings = positions[:, KINGS]
+    triple_kings = positions[:, TRIPLE_KINGS]
+    men = ~(kings | triple_kings)
+    any_king = kings | triple_kings
+    empty_squares = ~(black_pieces | white_pieces)
+
+    black_count = popcount(black_pieces)
+    white_count = popcount(white_pieces)
+    features = {
+        "black_men": popcount(black_pieces & men),
+        "black_kings": popcount(black_pieces & kings),
+        "black_triple_kings": popcount(black_pieces & triple_kings),
+        "white_men": popcount(white_pieces & men),
+        "white_kings": popcount(white_pieces & kings),
+        "white_triple_kings": popcount(white_pieces & triple_kings),
+        "black_captured": 12 - white_count,
+        "white_captured": 12 - black_count,
+        # Black moves up the board and white moves down it; kings go both ways
+        "black_mobility": _mobility((_step_up_left, _step_up_right), (_step_down_left, _step_down_right),
+                                    black_pieces, white_pieces, any_king, empty_squares),
+        "white_mobility": _mobility((_step_down_left, _step_down_right), (_step_up_left, _step_up_right),
+                                    white_pieces, black_pieces, any_king, empty_squares),
+    }
+    return features
+
+
+def batch_evaluate(positions):
+    """Scores every position in an N x 4 packed positions array by material from black's point of view, the same
+        way checkers_ai.evaluate(game, "Black") does"""
+    features = batch_features(positions)
+    black_score = features["black_men"] * MAN_VALUE + features["black_kings"] * KING_VALUE + \
+        features["black_triple_kings"] * TRIPLE_KING_VALUE
+    white_score = features["white_men"] * MAN_VALUE + features["white_kings"] * KING_VALUE + \
+        features["white_triple_kings"] * TRIPLE_KING_VALUE
+    return black_score - white_score
@@ -0,0 +1,196 @@
+# Author: agent
+# GitHub username: agent
+# Date: 10/18/2026
+# Description: Benchmarks for the checkers game's hot paths, run over scripted games that are the same on every run:
+#   play_game timed move by move and split by which path the move takes (a black man capturing, a white man
+#   capturing, a king or triple king capturing, or a plain move), the Player counters, game_winner, and how many
+#   whole games per second can be replayed. Results are written as JSON, and a saved run can be passed back in as a
+#   baseline to flag anything that got slower.
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+
+from checkers_game import Checkers
+from checkers_simulator import play_one_game
+from checkers_simulator import random_policy
+
+
+# The play_game paths moves are timed under
+PATHS = ("black_standard_capture", "white_standard_capture", "king_capture", "piece_move")
+
+# Results more than this much slower than the baseline count as regressions
+DEFAULT_TOLERANCE = 0.10
+
+
+def scripted_games(count, seed=0):
+    """Returns count games, each a list of (color, start square location, destination square location) for every
+        play_game call in it. Game i is the random game the simulator plays with seed + i, so the same arguments always
+        give the same games."""
+    games = []
+    for game_number in range(count):
+        moves = play_one_game(random_policy, seed + game_number)[1]
+        color = "Black"
+        hops = []
+        for move in moves:
+            for index in range(1, len(move)):
+                hops.append((color, move[index - 1], move[index]))
+            color = "White" if color == "Black" else "Black"
+        games.append(hops)
+    return games
+
+
+def _new_game():
+    """Returns a new game with the players the scripted games are played by"""
+    game = Checkers()
+    game.create_player("Black", "Black")
+    game.create_player("White", "White")
+    return game
+
+
+def _move_path(game, start, destination):
+    """Returns which of PATHS play_game will take for a move"""
+    if abs(destination[0] - start[0]) != 2:
+        return "piece_move"
+    piece = game.get_checker_details(start)
+    if piece == "Black":
+        return "black_standard_capture"
+    if piece == "White":
+        return "white_standard_capture"
+    return "king_capture"
+
+
+def _summary(samples):
+    """Sums up a list of times in nanoseconds"""
+    if not samples:
+        return {"calls": 0}
+    ordered = sorted(samples)
+    return {"calls": len(samples), "mean_ns": statistics.fmean(samples), "median_ns": statistics.median(ordered),
+            "p90_ns": ordered[int(len(ordered) * 0.9)], "min_ns": ordered[0]}
+
+
+def time_play_game(games, rounds):
+    """Times every play_game call in the games, rounds times over, and returns the times split by path"""
+    samples = {path: [] for path in PATHS}
+    clock = time.perf_counter_ns
+    for round_number in range(rounds):
+        for hops in games:
+            game = _new_game()
+            for color, start, destination in hops:
+                path = _move_path(game, start, destination)
+                started = clock()
+                game.play_game(color, start, destination)
+                samples[path].append(clock() - started)
+    return {path: _summary(samples[path]) for path in PATHS}
+
+
+def time_queries(games, repeat, every=10):
+    """Times the Player counters and game_winner on every tenth position of the games (and each final position),
+        calling each one repeat times in a row per position"""
+    queries = ("get_king_count", "get_triple_king_count", "get_captured_pieces_count", "game_winner")
+    samples = {query: [] for query in queries}
+    clock = time.perf_counter_ns
+    for hops in games:
+        game = _new_game()
+        black, white = game.get_players()
+        for hop_number, (color, start, destination) in enumerate(hops, 1):
+            game.play_game(color, start, destination)
+            if hop_number % every and hop_number != len(hops):
+                continue
+
+            for player in (black, white):
+                for query in queries[:3]:
+                    method = getattr(player, query)
+                    started = clock()
+                    for call in range(repeat):
+                        method()
+                    samples[query].append((clock() - started) / repeat)
+            started = clock()
+            for call in range(repeat):
+                game.game_winner()
+            samples["game_winner"].append((clock() - started) / repeat)
+    return {query: _summary(samples[query]) for query in queries}
+
+
+def time_replays(games, rounds):
+    """Replays every game from the start, rounds times over, and returns how many games and moves per second that
+        came to"""
+    moves = sum(len(hops) for hops in games) * rounds
+    started = time.perf_counter()
+    for round_number in range(rounds):
+        for hops in games:
+            game = _new_game()
+            for color, start, destination in hops:
+                game.play_game(color, start, destination)
+    elapsed = time.perf_counter() - started
+    return {"games": len(games) * rounds, "moves": moves, "seconds": elapsed,
+            "games_per_second": len(games) * rounds / elapsed, "moves_per_second": moves / elapsed}
+
+
+def run_benchmarks(game_count=50, rounds=5, seed=0, repeat=100):
+    """Runs every benchmark and returns the results as a dict ready to be written as JSON"""
+    games = scripted_games(game_count, seed)
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "games": game_count,
+        "rounds": rounds,
+        "seed": seed,
+        "play_game": time_play_game(games, rounds),
+        "queries": time_queries(games, repeat),
+        "replay": time_replays(games, rounds),
+    }
+
+
+def compare_results(baseline, current, tolerance=DEFAULT_TOLERANCE):
+    """Compares two runs and returns a list of (benchmark name, baseline, current) for every benchmark that got more
+        than tolerance slower: median time per call for play_game paths and queries, and games per second for
+        replays"""
+    regressions = []
+    for section in ("play_game", "queries"):
+        for name, summary in current.get(section, {}).items():
+            old_summary = baseline.get(section, {}).get(name, {})
+            if "median_ns" in summary and "median_ns" in old_summary and \
+                    summary["median_ns"] > old_summary["median_ns"] * (1 + tolerance):
+                regressions.append((section + "." + name, old_summary["median_ns"], summary["median_ns"]))
+
+    old_rate = baseline.get("replay", {}).get("games_per_second")
+    rate = current.get("replay", {}).get("games_per_second")
+    if old_rate and rate and rate < old_rate / (1 + tolerance):
+        regressions.append(("replay.games_per_second", old_rate, rate))
+    return regressions
+
+
+def main():
+    """Runs the benchmarks from the command line, writes the results as JSON, and exits with status 1 if any got
+        slower than the baseline"""
+    parser = argparse.ArgumentParser(description="Benchmark the checkers game")
+    parser.add_argument("--games", type=int, default=50, help="how many scripted games to play")
+    parser.add_argument("--rounds", type=int, default=5, help="how many times to play them")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the results to this file instead of printing them")
+    parser.add_argument("--baseline", help="a results file from an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    arguments = parser.parse_args()
+
+    results = run_benchmarks(arguments.games, arguments.rounds, arguments.seed)
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            json.dump(results, file, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if arguments.baseline:
+        with open(arguments.baseline) as file:
+            regressions = compare_results(json.load(file), results, arguments.tolerance)
+        for name, old_value, value in regressions:
+            print(f"Slower: {name} went from {old_value:.0f} to {value:.0f}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
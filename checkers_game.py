@@ -6,6 +6,10 @@
 #   color. Has exceptions for OutofTurn, InvalidSquare, and InvalidPlayer.
 #   Just like in regular checkers, black goes first and is enforced to go first.
 
+import random
+import struct
+import time
+from enum import IntEnum
 
 
 class OutofTurn(Exception):
@@ -23,6 +27,269 @@ class InvalidPlayer(Exception):
     pass
 
 
+class Piece(IntEnum):
+    """Small integer codes for the six kinds of piece. Black pieces come first, then white, and within each color the
+        man, the king and then the triple king, so code // 3 is the color and code % 3 the rank."""
+    BLACK = 0
+    BLACK_KING = 1
+    BLACK_TRIPLE_KING = 2
+    WHITE = 3
+    WHITE_KING = 4
+    WHITE_TRIPLE_KING = 5
+
+
+# The names get_checker_details and get_board have always used for each piece, indexed by Piece code
+_PIECE_NAMES = ("Black", "Black_king", "Black_Triple_King", "White", "White_king", "White_Triple_King")
+_PIECES_BY_NAME = {name: Piece(code) for code, name in enumerate(_PIECE_NAMES)}
+
+
+# Only the 32 dark squares can ever hold a piece, so the board is stored as bitboards: integers where bit n is set
+#   when the n-th dark square (counting left to right, top to bottom) holds that kind of piece. A position is four
+#   masks: all black pieces, all white pieces, kings, and triple kings (a piece is a plain man when it is in neither
+#   of the last two).
+_SQUARE_LOCATIONS = tuple((row, column) for row in range(8) for column in range(8) if (row + column) % 2 == 1)
+_SQUARES = {location: square for square, location in enumerate(_SQUARE_LOCATIONS)}
+
+# The directions a piece can move in, as (row step, column step): up-left, up-right, down-left and down-right.
+#   Black pieces move up the board toward row 0 and white pieces move down it toward row 7. Kings and triple kings
+#   can move in all four directions.
+_DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+_BLACK_DIRECTIONS = (0, 1)
+_WHITE_DIRECTIONS = (2, 3)
+_KING_DIRECTIONS = (0, 1, 2, 3)
+
+
+def _build_move_table():
+    """Builds the lookup table of (step square, jump square) for every dark square and direction. A square is None
+        when it would be off the board."""
+    move_table = []
+    for row, column in _SQUARE_LOCATIONS:
+        move_table.append(tuple((_SQUARES.get((row + row_step, column + column_step)),
+                                 _SQUARES.get((row + 2 * row_step, column + 2 * column_step)))
+                                for row_step, column_step in _DIRECTIONS))
+    return tuple(move_table)
+
+
+# _MOVE_TABLE[square][direction] is (step square, jump square), built once so moves never recompute neighbors.
+_MOVE_TABLE = _build_move_table()
+
+# Bitboard masks of every dark square, of row 0, where black pieces are kinged, and of row 7, where white pieces are
+#   kinged.
+_ALL_SQUARES = (1 << 32) - 1
+_TOP_ROW = 0xF
+_BOTTOM_ROW = 0xF << 28
+
+# For each Piece code: the directions the piece moves and captures in, and the row that promotes it along with what
+#   it becomes. Triple kings are never promoted again.
+_PIECE_DIRECTIONS = (_BLACK_DIRECTIONS, _KING_DIRECTIONS, _KING_DIRECTIONS,
+                     _WHITE_DIRECTIONS, _KING_DIRECTIONS, _KING_DIRECTIONS)
+_PROMOTIONS = ((_TOP_ROW, Piece.BLACK_KING), (_BOTTOM_ROW, Piece.BLACK_TRIPLE_KING), (0, Piece.BLACK_TRIPLE_KING),
+               (_BOTTOM_ROW, Piece.WHITE_KING), (_TOP_ROW, Piece.WHITE_TRIPLE_KING), (0, Piece.WHITE_TRIPLE_KING))
+
+
+def _build_destination_masks():
+    """Builds, for every Piece code and square, the bitboard of squares that piece could ever move to from there: one
+        step or one jump in each of its directions"""
+    destination_masks = []
+    for directions in _PIECE_DIRECTIONS:
+        masks = []
+        for square in range(32):
+            mask = 0
+            for direction in directions:
+                for destination in _MOVE_TABLE[square][direction]:
+                    if destination is not None:
+                        mask |= 1 << destination
+            masks.append(mask)
+        destination_masks.append(tuple(masks))
+    return tuple(destination_masks)
+
+
+def _build_jumped_bits():
+    """Builds the table of which square a jump passes over: the bitboard bit of the square between a start square and
+        a destination square two diagonal steps away, or 0 when the move is not a jump"""
+    jumped_bits = [[0] * 32 for square in range(32)]
+    for square in range(32):
+        for step_square, jump_square in _MOVE_TABLE[square]:
+            if jump_square is not None:
+                jumped_bits[square][jump_square] = 1 << step_square
+    return tuple(tuple(row) for row in jumped_bits)
+
+
+# _DESTINATION_MASKS[piece][square] and _JUMPED_BITS[start square][destination square], so play_game can turn down a
+#   move a piece can't make with a couple of lookups, before any capture logic runs
+_DESTINATION_MASKS = _build_destination_masks()
+_JUMPED_BITS = _build_jumped_bits()
+
+
+# Zobrist keys: one random 64-bit number for each kind of piece on each square, plus one for black being the side to
+#   move. A position's hash is the XOR of the keys for everything in it, so a move only has to XOR in the keys that
+#   changed. The seed is fixed so every process, and every file of saved hashes, agrees on the same keys.
+_ZOBRIST_RANDOM = random.Random(20230319)
+_ZOBRIST_PIECE_KEYS = tuple(tuple(_ZOBRIST_RANDOM.getrandbits(64) for square in range(32)) for piece in Piece)
+_ZOBRIST_BLACK_TO_MOVE = _ZOBRIST_RANDOM.getrandbits(64)
+
+
+def _piece_code(black_pieces, kings, triple_kings, bit):
+    """Returns the Piece code, as a plain int, of the piece on a bitboard bit. The bit must hold a piece."""
+    code = Piece.BLACK if black_pieces & bit else Piece.WHITE
+    if kings & bit:
+        return code + 1
+    if triple_kings & bit:
+        return code + 2
+    return code
+
+
+def _position_hash(black_pieces, white_pieces, kings, triple_kings, black_to_move):
+    """Hashes a whole position from scratch. Games keep their hash up to date move by move instead of calling this."""
+    position_hash = _ZOBRIST_BLACK_TO_MOVE if black_to_move else 0
+    pieces = black_pieces | white_pieces
+    while pieces:
+        bit = pieces & -pieces
+        pieces ^= bit
+        position_hash ^= _ZOBRIST_PIECE_KEYS[_piece_code(black_pieces, kings, triple_kings, bit)][bit.bit_length() - 1]
+    return position_hash
+
+
+def _jump_sequences(path, directions, enemy_pieces, empty_squares, promotion_row):
+    """Yields every full jump sequence that continues the path of squares given. Captured pieces come off the board
+        as they are jumped, and a piece that gets promoted ends its move where it lands."""
+    square = path[-1]
+    extended = False
+    for direction in directions:
+        step_square, jump_square = _MOVE_TABLE[square][direction]
+        if jump_square is None or not enemy_pieces & (1 << step_square) or not empty_squares & (1 << jump_square):
+            continue
+
+        extended = True
+        path.append(jump_square)
+        if (1 << jump_square) & promotion_row:
+            yield tuple(path)
+        else:
+            yield from _jump_sequences(path, directions, enemy_pieces & ~(1 << step_square),
+                                       (empty_squares | (1 << square) | (1 << step_square)) & ~(1 << jump_square),
+                                       promotion_row)
+        path.pop()
+
+    if not extended and len(path) > 1:
+        yield tuple(path)
+
+
+def square_number(square_location):
+    """Returns the number (0 to 31) of a dark square, counting left to right and top to bottom, or None if the location
+        is off the board or a light square"""
+    return _SQUARES.get((square_location[0], square_location[1]))
+
+
+def square_location(square_number):
+    """Returns the (row, column) location of a dark square from its number"""
+    return _SQUARE_LOCATIONS[square_number]
+
+
+def _square_bit(row, column):
+    """Returns the bitboard bit for a dark square, or 0 if the square is off the board or a light square"""
+    square = _SQUARES.get((row, column))
+    if square is None:
+        return 0
+    return 1 << square
+
+
+def _piece_name(black_pieces, white_pieces, kings, triple_kings, bit):
+    """Returns the name the rest of the game uses for the piece on a bitboard bit, or None if it is empty"""
+    if not (black_pieces | white_pieces) & bit:
+        return None
+    return _PIECE_NAMES[_piece_code(black_pieces, kings, triple_kings, bit)]
+
+
+def _pack_game_board(game_board):
+    """Turns an 8x8 list of piece names into the black, white, king and triple king bitboards"""
+    black_pieces = white_pieces = kings = triple_kings = 0
+    for row in range(8):
+        for column in range(8):
+            piece = game_board[row][column]
+            if piece is None:
+                continue
+
+            bit = _square_bit(row, column)
+            if not bit or piece not in _PIECES_BY_NAME:
+                raise InvalidSquare
+
+            color, rank = divmod(_PIECES_BY_NAME[piece], 3)
+            if color == 0:
+                black_pieces |= bit
+            else:
+                white_pieces |= bit
+
+            if rank == 1:
+                kings |= bit
+            elif rank == 2:
+                triple_kings |= bit
+
+    return black_pieces, white_pieces, kings, triple_kings
+
+
+class _BoardRowView:
+    """One row of a _BoardView"""
+
+    def __init__(self, source, row):
+        self._source = source
+        self._row = row
+
+    def __getitem__(self, column):
+        if isinstance(column, slice):
+            return [self[index] for index in range(8)[column]]
+        return _piece_name(*self._source.get_bitboards(), _square_bit(self._row, range(8)[column]))
+
+    def __iter__(self):
+        for column in range(8):
+            yield self[column]
+
+    def __len__(self):
+        return 8
+
+    def __eq__(self, other):
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class _BoardView:
+    """Read-only 8x8 view of a bitboard position. Indexing it gives back the same strings the old list of lists
+        held ("Black", "White_king", "Black_Triple_King", None...), and it always reflects the current position."""
+
+    def __init__(self, source):
+        self._source = source
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self[index] for index in range(8)[row]]
+        return _BoardRowView(self._source, range(8)[row])
+
+    def __iter__(self):
+        for row in range(8):
+            yield _BoardRowView(self._source, row)
+
+    def __len__(self):
+        return 8
+
+    def __eq__(self, other):
+        try:
+            return [list(row) for row in self] == [list(row) for row in other]
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return repr([list(row) for row in self])
+
+    def get_key(self):
+        """Get a hashable snapshot of the position shown, the same for any two boards that look the same. Unlike the
+            view itself it does not change as moves are made, so it can key a dict."""
+        return self._source.get_bitboards()
+
+
 class CheckersBoard:
     """Class that sets up a generic checkers board"""
     def __init__(self):
@@ -36,7 +303,7 @@ class CheckersBoard:
             [(6, 0), (6, 1), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 7)]
             [(7, 0), (7, 1), (7, 2), (7, 3), (7, 4), (7, 5), (7, 6), (7, 7)]
             ]"""
-        self._game_board = [
+        self._black_pieces, self._white_pieces, self._kings, self._triple_kings = _pack_game_board([
             [None, "White", None, "White", None, "White", None, "White"],
             ["White", None, "White", None, "White", None, "White", None],
             [None, "White", None, "White", None, "White", None, "White"],
@@ -45,25 +312,49 @@ class CheckersBoard:
             ["Black", None, "Black", None, "Black", None, "Black", None],
             [None, "Black", None, "Black", None, "Black", None, "Black"],
             ["Black", None, "Black", None, "Black", None, "Black", None]
-            ]
+            ])
+
+    def get_bitboards(self):
+        """Get the black, white, king and triple king bitboards"""
+        return self._black_pieces, self._white_pieces, self._kings, self._triple_kings
 
     def get_game_board(self):
         """Get the game board"""
-        return self._game_board
+        return _BoardView(self)
+
+
+# A game snapshot from Checkers.to_bytes, always 64 bytes: format version, which players exist and which of them play
+#   white, black and white turn counters, black and white capture counters, the four bitboards, the position hash,
+#   then each player's name as a length byte and up to 15 bytes of UTF-8
+_SNAPSHOT = struct.Struct("<BBHHBB4IQ16p16p")
+_SNAPSHOT_VERSION = 1
+_MAX_SNAPSHOT_NAME_BYTES = 15
+
+# Every new game starts from the same bitboards and hash, so they are worked out once instead of once per game
+_STARTING_POSITION = CheckersBoard().get_bitboards()
+_STARTING_HASH = _position_hash(*_STARTING_POSITION, True)
 
 
 class Checkers:
     """Will allow for two players to play a traditional game of checkers. Will create the game, the board, and
         players using composition and the Player class."""
 
+    __slots__ = ("_black_pieces", "_white_pieces", "_kings", "_triple_kings", "_player_1", "_player_2",
+                 "_black_turn", "_white_turn", "_black_capture", "_white_capture", "_undo_stack", "_hash",
+                 "_move_recorder", "_instrumentation")
+
     def __init__(self):
-        self._board = CheckersBoard().get_game_board()
+        self._black_pieces, self._white_pieces, self._kings, self._triple_kings = _STARTING_POSITION
         self._player_1 = None
         self._player_2 = None
         self._black_turn = 0
         self._white_turn = 0
         self._black_capture = 0
         self._white_capture = 0
+        self._undo_stack = None
+        self._move_recorder = None
+        self._instrumentation = None
+        self._hash = _STARTING_HASH
 
     def get_black_turn(self):
         """Get how many turns black has played"""
@@ -73,6 +364,53 @@ class Checkers:
         """Get how many turns white has played"""
         return self._white_turn
 
+    def get_bitboards(self):
+        """Get the black, white, king and triple king bitboards"""
+        return self._black_pieces, self._white_pieces, self._kings, self._triple_kings
+
+    def set_bitboards(self, black_pieces, white_pieces, kings, triple_kings, black_to_move=True):
+        """Set up any position from its black, white, king and triple king bitboards, with the side to move given.
+            The turn and capture counters and the undo stack start over, with white one turn behind if it is white's
+            move."""
+        self._black_pieces, self._white_pieces = black_pieces, white_pieces
+        self._kings, self._triple_kings = kings, triple_kings
+        self._black_turn = 0 if black_to_move else 1
+        self._white_turn = 0
+        self._black_capture = 0
+        self._white_capture = 0
+        self._undo_stack = None
+        self._hash = _position_hash(black_pieces, white_pieces, kings, triple_kings, black_to_move)
+
+    def get_piece_counts(self, color):
+        """Get how many men, kings and triple kings the color given ("Black" or "White") has on the board, as a tuple.
+            The bitboards are the counts, so this never scans the board and can never drift from it."""
+        pieces = self._black_pieces if color == "Black" else self._white_pieces
+        kings = pieces & self._kings
+        triple_kings = pieces & self._triple_kings
+        return (pieces ^ kings ^ triple_kings).bit_count(), kings.bit_count(), triple_kings.bit_count()
+
+    def position_hash(self):
+        """Get the 64-bit Zobrist hash of the position: every piece on the board and the side to move. It is kept up
+            to date as moves are made, so this costs nothing."""
+        return self._hash
+
+    def get_players(self):
+        """Get the two players, in the order they were created. A player not created yet is None."""
+        return self._player_1, self._player_2
+
+    def set_move_recorder(self, move_recorder):
+        """Set a function to be called as move_recorder(start square number, destination square number) after every
+            move play_game accepts, or None to stop recording"""
+        self._move_recorder = move_recorder
+
+    def set_instrumentation(self, sink):
+        """Set a function to be called as sink(phase timings, error name) after every play_game call, or None to turn
+            instrumentation off. The phase timings are a dict of nanoseconds spent in each phase of the move that ran
+            ("in_bounds", "validate_turn", "standard_capture" or "king_capture", and "piece_move"), and the error name
+            is the name of the exception the move raised, or None if it was played. With no sink set, play_game
+            doesn't read the clock at all."""
+        self._instrumentation = sink
+
     def create_player(self, player_name, piece_color):
         """create a player object using the Player class"""
         if self._player_1 is None:
@@ -89,883 +427,501 @@ class Checkers:
             Uses exceptions to make sure a player does not play out of turn or move to an invalid square.
             Will also promote pieces to kings/triple kings when relevant and returns the number of captured pieces after
             a move has been made. Will also have a counter for player turns and will enforce jumps after a move"""
-        start = self._board[starting_square_location[0]][starting_square_location[1]]
-
-        end = self._board[destination_square_location[0]][destination_square_location[1]]
-
-        def in_bounds():
-            """Check if the player's move is in-bounds or not"""
-            # If the destination square is off the table, raise exception.
-            if destination_square_location[0] > 7 or destination_square_location[1] > 7:
-                raise InvalidSquare
-
-            # if the destination square is off the table, raise exception.
-            elif destination_square_location[0] < 0 or destination_square_location[1] < 0:
-                raise InvalidSquare
-
-            # if the destination square is not None, then it cannot move to that location.
-            if self._board[destination_square_location[0]][destination_square_location[1]] is not None:
-                raise InvalidSquare
-
-        def validate_turn():
-            """Validate whose turn it is"""
-            # Figure out whose turn it is
-            if self._player_1.get_player_name() == player_name:
-                player = self._player_1
-
-            elif self._player_2.get_player_name() == player_name:
-                player = self._player_2
-            # if player_name is not the name of player_1 or player_2, raise InvalidPlayer
+        error = self.try_play_game(player_name, starting_square_location, destination_square_location)
+        if error is not None:
+            raise error
+
+    def try_play_game(self, player_name, starting_square_location, destination_square_location):
+        """Plays a move exactly like play_game, but instead of raising OutofTurn, InvalidSquare or InvalidPlayer it
+            returns that exception class, leaving the game as it was. Returns None when the move is played. Nothing is
+            raised, so checking a large number of moves costs no more than playing them."""
+        # Locations that aren't (row, column) of a dark square, whatever their length, come back as None here
+        start_square = _SQUARES.get(tuple(starting_square_location))
+        end_square = _SQUARES.get(tuple(destination_square_location))
+
+        sink = self._instrumentation
+        if sink is None:
+            error = self._in_bounds(end_square) or self._validate_turn(player_name, start_square)
+            if error is not None:
+                return error
+            piece = _piece_code(self._black_pieces, self._kings, self._triple_kings, 1 << start_square)
+            error = self._check_destination(piece, start_square, end_square)
+            if error is not None:
+                return error
+            # Only a jump can capture, and only the capture handler for the kind of piece moving runs
+            captured = _JUMPED_BITS[start_square][end_square] and \
+                _CAPTURE_HANDLERS[piece](self, start_square, end_square)
+            promoted = self._piece_move(piece, start_square, end_square)
+        else:
+            error, piece, captured, promoted = self._timed_steps(sink, player_name, start_square, end_square)
+            if error is not None:
+                return error
+        if self._move_recorder is not None:
+            self._move_recorder(start_square, end_square)
+
+        # if the piece captured and can capture again, the same player goes again. Otherwise, turn + 1
+        if captured and not promoted:
+            enemy_pieces = self._white_pieces if piece < Piece.WHITE else self._black_pieces
+            if self._can_capture_again(end_square, _PIECE_DIRECTIONS[piece], enemy_pieces):
+                return None
+        if piece < Piece.WHITE:
+            self._black_turn += 1
+        else:
+            self._white_turn += 1
+        self._hash ^= _ZOBRIST_BLACK_TO_MOVE
+        return None
+
+    def _timed_steps(self, sink, player_name, start_square, end_square):
+        """The steps of try_play_game with each one timed and the timings handed to the instrumentation sink. Returns
+            the exception class the move was turned down with (or None), the Piece code of the piece moved, whether it
+            captured, and whether it was promoted."""
+        clock = time.perf_counter_ns
+        timings = {}
+        try:
+            started = clock()
+            error = self._in_bounds(end_square)
+            timings["in_bounds"] = clock() - started
+
+            if error is None:
+                started = clock()
+                error = self._validate_turn(player_name, start_square)
+                timings["validate_turn"] = clock() - started
+            if error is None:
+                started = clock()
+                piece = _piece_code(self._black_pieces, self._kings, self._triple_kings, 1 << start_square)
+                error = self._check_destination(piece, start_square, end_square)
+                timings["check_destination"] = clock() - started
+            if error is not None:
+                sink(timings, error.__name__)
+                return error, None, False, False
+
+            captured = False
+            if _JUMPED_BITS[start_square][end_square]:
+                started = clock()
+                captured = _CAPTURE_HANDLERS[piece](self, start_square, end_square)
+                timings[_CAPTURE_PHASES[piece]] = clock() - started
+
+            started = clock()
+            promoted = self._piece_move(piece, start_square, end_square)
+            timings["piece_move"] = clock() - started
+        except Exception as error:
+            sink(timings, type(error).__name__)
+            raise
+        sink(timings, None)
+        return None, piece, captured, promoted
+
+    def _in_bounds(self, end_square):
+        """Check if the player's move is in-bounds or not. Returns InvalidSquare if it isn't, otherwise None."""
+        # If the destination square is off the table, or is a light square, it is invalid.
+        if end_square is None:
+            return InvalidSquare
+
+        # if the destination square is not empty, then it cannot move to that location.
+        if (self._black_pieces | self._white_pieces) & (1 << end_square):
+            return InvalidSquare
+        return None
+
+    def _validate_turn(self, player_name, start_square):
+        """Validate whose turn it is and that the player is moving their own piece. Returns the exception class for
+            the first problem found, otherwise None."""
+        start = 0 if start_square is None else 1 << start_square
+
+        # Figure out whose turn it is
+        if self._player_1.get_player_name() == player_name:
+            player = self._player_1
+
+        elif self._player_2.get_player_name() == player_name:
+            player = self._player_2
+        # if player_name is not the name of player_1 or player_2, it is an InvalidPlayer
+        else:
+            return InvalidPlayer
+
+        # if it's black's turn, make sure the current player is playing black (black goes first)
+        if self._black_turn <= self._white_turn:
+            if player.get_checker_color() == "Black":
+                # Because it's black's turn, the piece being moved must be black
+                if not self._black_pieces & start:
+                    return InvalidSquare
             else:
-                raise InvalidPlayer
-
-            # if it's black's turn, make sure the current player is playing black (black goes first)
-            if self._black_turn <= self._white_turn:
-                if player.get_checker_color() == "Black":
-                    # Because it's black's turn, the piece being moved must be black
-                    if self.get_checker_details(starting_square_location) != "Black" and \
-                        self.get_checker_details(starting_square_location) != "Black_king" and \
-                            self.get_checker_details(starting_square_location) != "Black_Triple_King":
-                        raise InvalidSquare
-                else:
-                    raise OutofTurn
-
-            # if it's white's turn, make sure the current player is playing white
-            elif self._white_turn < self._black_turn:
-                if player.get_checker_color() == "White":
-                    # Because it's white's turn, the piece being moved must be white
-                    if self.get_checker_details(starting_square_location) != "White" and \
-                        self.get_checker_details(starting_square_location) != "White_king" and \
-                            self.get_checker_details(starting_square_location) != "White_Triple_King":
-                        raise InvalidSquare
-                else:
-                    raise OutofTurn
-
-            # Now that we have verified player color, we need to verify if a piece is captured by the move
-        def black_standard_capture():
-            """If the piece is black, check if it needs to capture a piece"""
-            # if the piece is a standard black piece, proceed
-            if self.get_checker_details(starting_square_location) == "Black":
-
-                # Check first legal position, then proceed
-                if starting_square_location[0] - 1 >= 0 and starting_square_location[1] - 1 >= 0:
-                    if self._board[starting_square_location[0] - 1][starting_square_location[1] - 1] == "White" or \
-                            self._board[starting_square_location[0] - 1][
-                                starting_square_location[1] - 1] == "White_king" or \
-                            self._board[starting_square_location[0] - 1][
-                                starting_square_location[1] - 1] == "White_Triple_King":
-                        # if the space after enemy square is the destination, capture piece
-                        if destination_square_location[0] == starting_square_location[0] - 2 and \
-                                destination_square_location[1] == starting_square_location[1] - 2:
-                            self._board[starting_square_location[0] - 1][starting_square_location[1] - 1] = None
-                            self._black_capture += 1
-
-                            # check if another capture needs to happen. If not, turn + 1
-                            if destination_square_location[0] - 2 >= 0 and destination_square_location[1] - 2 >= 0:
-                                if self._board[destination_square_location[0] - 1][
-                                    destination_square_location[1] - 1] is None or \
-                                        self._board[destination_square_location[0] - 1][
-                                            destination_square_location[1] - 1] != "White" and \
-                                        self._board[destination_square_location[0] - 1][
-                                            destination_square_location[1] - 1] != "White_king" and \
-                                        self._board[destination_square_location[0] - 1][
-                                            destination_square_location[1] - 1] != "White_Triple_King" or \
-                                        self._board[destination_square_location[0] - 2][
-                                            destination_square_location[1] - 2] is not None:
-                                    self._black_turn += 1
-                                    return
-
-                            if destination_square_location[0] - 2 >= 0:
-                                if self._board[destination_square_location[0] - 1][
-                                    destination_square_location[1]] is None or \
-                                        self._board[destination_square_location[0] - 1][
-                                            destination_square_location[1]] != "White" and \
-                                        self._board[destination_square_location[0] - 1][
-                                            destination_square_location[1]] != "White_king" and \
-                                        self._board[destination_square_location[0] - 1][
-                                            destination_square_location[1]] != "White_Triple_King" or \
-                                        self._board[destination_square_location[0] - 2][
-                                            destination_square_location[1]] is not None:
-                                    self._black_turn += 1
-                                    return
-
-                            if destination_square_location[0] - 2 >= 0 and destination_square_location[1] + 2 <= 7:
-                                if self._board[destination_square_location[0] - 1][
-                                    destination_square_location[1] + 1] is None or \
-                                        self._board[destination_square_location[0] - 1][
-                                            destination_square_location[1] + 1] != "White" and \
-                                        self._board[destination_square_location[0] - 1][
-                                            destination_square_location[1] + 1] != "White_king" and \
-                                        self._board[destination_square_location[0] - 1][
-                                            destination_square_location[1] + 1] != "White_Triple_King" or \
-                                        self._board[destination_square_location[0] - 2][
-                                            destination_square_location[1] + 2] is not None:
-                                    self._black_turn += 1
-                                    return
-
-                            else:
-                                self._black_turn += 1
-                                return
-
-
-                #check second legal position, then proceed
-                if starting_square_location[0] - 1 >= 0:
-                    if self._board[starting_square_location[0] - 1][starting_square_location[1]] == "White" or \
-                         self._board[starting_square_location[0] - 1][starting_square_location[1]] == "White_king" or \
-                         self._board[starting_square_location[0] - 1][
-                             starting_square_location[1]] == "White_Triple_King":
-                        # if the space after enemy square is the destination, capture piece
-                        if destination_square_location[0] == starting_square_location[0] - 2 and \
-                                destination_square_location[1] == starting_square_location[1]:
-                            self._board[starting_square_location[0] - 1][starting_square_location[1]] = None
-                            self._black_capture += 1
-
-                        # check if another capture needs to happen. If not, turn +1
-                        if destination_square_location[0] - 2 >= 0 and destination_square_location[1] - 2 >= 0:
-                            if self._board[destination_square_location[0] - 1][
-                                destination_square_location[1] - 1] is None or \
-                                    self._board[destination_square_location[0] - 1][
-                                        destination_square_location[1] - 1] != "White" and \
-                                    self._board[destination_square_location[0] - 1][
-                                        destination_square_location[1] - 1] != "White_king" and \
-                                    self._board[destination_square_location[0] - 1][
-                                        destination_square_location[1] - 1] != "White_Triple_King" or \
-                                    self._board[destination_square_location[0] - 2][
-                                        destination_square_location[1] - 2] is not None:
-                                self._black_turn += 1
-                                return
-
-                        if destination_square_location[0] - 2 >= 0:
-                            if self._board[destination_square_location[0] - 1][
-                                destination_square_location[1]] is None or \
-                                    self._board[destination_square_location[0] - 1][
-                                        destination_square_location[1]] != "White" and \
-                                    self._board[destination_square_location[0] - 1][
-                                        destination_square_location[1]] != "White_king" and \
-                                    self._board[destination_square_location[0] - 1][
-                                        destination_square_location[1]] != "White_Triple_King" or \
-                                    self._board[destination_square_location[0] - 2][
-                                        destination_square_location[1]] is not None:
-                                self._black_turn += 1
-                                return
-
-                        if destination_square_location[0] - 2 >= 0 and destination_square_location[1] + 2 <= 7:
-                            if self._board[destination_square_location[0] - 1][
-                                destination_square_location[1] + 1] is None or \
-                                    self._board[destination_square_location[0] - 1][
-                                        destination_square_location[1] + 1] != "White" and \
-                                    self._board[destination_square_location[0] - 1][
-                                        destination_square_location[1] + 1] != "White_king" and \
-                                    self._board[destination_square_location[0] - 1][
-                                        destination_square_location[1] + 1] != "White_Triple_King" or \
-                                    self._board[destination_square_location[0] - 2][
-                                        destination_square_location[1] + 2] is not None:
-                                self._black_turn += 1
-                                return
-
-                        else:
-                            self._black_turn += 1
-                            return
-
-
-                # check last legal position, then proceed
-                if starting_square_location[0] - 1 >= 0 and starting_square_location[1] + 1 <= 7:
-                    if self._board[starting_square_location[0] - 1][starting_square_location[1] + 1] == "White" or \
-                         self._board[starting_square_location[0] - 1][starting_square_location[1] + 1] == "White_king" or \
-                         self._board[starting_square_location[0] - 1][starting_square_location[1] + 1] == "White_Triple_King":
-                        # if the space after enemy square is the destination, capture piece
-                        if destination_square_location[0] == starting_square_location[0] - 2 and \
-                                destination_square_location[1] == starting_square_location[1] + 2:
-                            self._board[starting_square_location[0] - 1][starting_square_location[1] + 1] = None
-                            self._black_capture += 1
-
-                        # check if another capture needs to happen. If not, turn +1
-                        if destination_square_location[0] - 2 >= 0 and destination_square_location[1] - 2 >= 0:
-                            if self._board[destination_square_location[0] - 1][
-                                destination_square_location[1] - 1] is None or \
-                                    self._board[destination_square_location[0] - 1][
-                                        destination_square_location[1] - 1] != "White" and \
-                                    self._board[destination_square_location[0] - 1][
-                                        destination_square_location[1] - 1] != "White_king" and \
-                                    self._board[destination_square_location[0] - 1][
-                                        destination_square_location[1] - 1] != "White_Triple_King" or \
-                                    self._board[destination_square_location[0] - 2][
-                                        destination_square_location[1] - 2] is not None:
-                                self._black_turn += 1
-                                return
-
-                        if destination_square_location[0] - 2 >= 0:
-                            if self._board[destination_square_location[0] - 1][
-                                destination_square_location[1]] is None or \
-                                    self._board[destination_square_location[0] - 1][
-                                        destination_square_location[1]] != "White" and \
-                                    self._board[destination_square_location[0] - 1][
-                                        destination_square_location[1]] != "White_king" and \
-                                    self._board[destination_square_location[0] - 1][
-                                        destination_square_location[1]] != "White_Triple_King" or \
-                                    self._board[destination_square_location[0] - 2][
-                                        destination_square_location[1]] is not None:
-                                self._black_turn += 1
-                                return
-
-                        if destination_square_location[0] - 2 >= 0 and destination_square_location[1] + 2 <= 7:
-                            if self._board[destination_square_location[0] - 1][
-                                destination_square_location[1] + 1] is None or \
-                                    self._board[destination_square_location[0] - 1][
-                                        destination_square_location[1] + 1] != "White" and \
-                                    self._board[destination_square_location[0] - 1][
-                                        destination_square_location[1] + 1] != "White_king" and \
-                                    self._board[destination_square_location[0] - 1][
-                                        destination_square_location[1] + 1] != "White_Triple_King" or \
-                                    self._board[destination_square_location[0] - 2][
-                                        destination_square_location[1] + 2] is not None:
-                                self._black_turn += 1
-                                return
-
-                        else:
-                            self._black_turn += 1
-                            return
-
-                    else:
-                        self._black_turn += 1
-
-                else:
-                    #if there's no capture, + 1 turn
-                    self._black_turn += 1
-
-        def white_standard_capture():
-            """If the piece is white, check if it needs to capture a piece"""
-            # if the piece is a standard white piece, proceed
-            if self.get_checker_details(starting_square_location) == "White":
-
-                # Check first legal position, then proceed
-                if starting_square_location[0] + 1 <= 7 and starting_square_location[1] + 1 <= 7:
-                    if self._board[starting_square_location[0] + 1][starting_square_location[1] + 1] == "Black" or \
-                            self._board[starting_square_location[0] + 1][
-                                starting_square_location[1] + 1] == "Black_king" or \
-                            self._board[starting_square_location[0] + 1][
-                                starting_square_location[1] + 1] == "Black_Triple_King":
-                        # if the space after enemy square is the destination, capture piece
-                        if destination_square_location[0] == starting_square_location[0] + 2 and \
-                                destination_square_location[1] == starting_square_location[1] + 2:
-                            self._board[starting_square_location[0] + 1][starting_square_location[1] + 1] = None
-                            self._white_capture += 1
-
-                            # check if another capture needs to happen. If not, turn +1
-                            if destination_square_location[0] + 2 <= 7 and destination_square_location[1] + 2 <= 7:
-                                if self._board[destination_square_location[0] + 1][
-                                    destination_square_location[1] + 1] is None or \
-                                        self._board[destination_square_location[0] + 1][
-                                            destination_square_location[1] + 1] != "Black" and \
-                                        self._board[destination_square_location[0] + 1][
-                                            destination_square_location[1] + 1] != "Black_king" and \
-                                        self._board[destination_square_location[0] + 1][
-                                            destination_square_location[1] + 1] != "Black_Triple_King" or \
-                                        self._board[destination_square_location[0] + 2][
-                                            destination_square_location[1] + 2] is not None:
-                                    self._white_turn += 1
-                                    return
-
-                            if destination_square_location[0] + 2 <= 7:
-                                if self._board[destination_square_location[0] + 1][destination_square_location[1]] \
-                                        is None or \
-                                        self._board[destination_square_location[0] + 1][destination_square_location[1]] \
-                                        != "Black" and \
-                                        self._board[destination_square_location[0] + 1][destination_square_location[1]] \
-                                        != "Black_king" and \
-                                        self._board[destination_square_location[0] + 1][
-                                            destination_square_location[1]] != \
-                                        "Black_Triple_King" or \
-                                        self._board[destination_square_location[0] + 2][destination_square_location[1]] \
-                                        is not None:
-                                    self._white_turn += 1
-                                    return
-
-                            if destination_square_location[0] + 2 <= 7 and destination_square_location[1] - 2 >= 0:
-                                if self._board[destination_square_location[0] + 1][
-                                    destination_square_location[1] - 1] is None or \
-                                        self._board[destination_square_location[0] + 1][
-                                            destination_square_location[1] - 1] != "Black" and \
-                                        self._board[destination_square_location[0] + 1][
-                                            destination_square_location[1] - 1] != "Black_king" and \
-                                        self._board[destination_square_location[0] + 1][
-                                            destination_square_location[1] - 1] != "Black_Triple_King" or \
-                                        self._board[destination_square_location[0] + 2][
-                                            destination_square_location[1] - 2] is not None:
-                                    self._white_turn += 1
-                                    return
-
-                            else:
-                                self._white_turn += 1
-                                return
-
-                # check second legal position, then proceed
-                if starting_square_location[0] + 1 <= 7:
-                    if self._board[starting_square_location[0] + 1][starting_square_location[1]] \
-                            == "Black" or \
-                            self._board[starting_square_location[0] + 1][starting_square_location[1]] \
-                            == "Black_king" or \
-                            self._board[starting_square_location[0] + 1][starting_square_location[1]] \
-                            == "Black_Triple_King":
-                        # if the space after enemy square is the destination, capture piece
-                        if destination_square_location[0] == starting_square_location[0] + 2 and \
-                                destination_square_location[1] == starting_square_location[1]:
-                            self._board[starting_square_location[0] + 1][starting_square_location[1]] = None
-                            self._white_capture += 1
-
-                            # check if another capture needs to happen. If not,turn +1
-                            if destination_square_location[0] + 2 <= 7 and destination_square_location[1] + 2 <= 7:
-                                if self._board[destination_square_location[0] + 1][
-                                    destination_square_location[1] + 1] is None or \
-                                        self._board[destination_square_location[0] + 1][
-                                            destination_square_location[1] + 1] != "Black" and \
-                                        self._board[destination_square_location[0] + 1][
-                                            destination_square_location[1] + 1] != "Black_king" and \
-                                        self._board[destination_square_location[0] + 1][
-                                            destination_square_location[1] + 1] != "Black_Triple_King" or \
-                                        self._board[destination_square_location[0] + 2][
-                                            destination_square_location[1] + 2] is not None:
-                                    self._white_turn += 1
-                                    return
-
-                            if destination_square_location[0] + 2 <= 7:
-                                if self._board[destination_square_location[0] + 1][destination_square_location[1]] \
-                                        is None or \
-                                        self._board[destination_square_location[0] + 1][destination_square_location[1]] \
-                                        != "Black" and \
-                                        self._board[destination_square_location[0] + 1][destination_square_location[1]] \
-                                        != "Black_king" and \
-                                        self._board[destination_square_location[0] + 1][
-                                            destination_square_location[1]] != \
-                                        "Black_Triple_King" or \
-                                        self._board[destination_square_location[0] + 2][destination_square_location[1]] \
-                                        is not None:
-                                    self._white_turn += 1
-                                    return
-
-                            if destination_square_location[0] + 2 <= 7 and destination_square_location[1] - 2 >= 0:
-                                if self._board[destination_square_location[0] + 1][
-                                    destination_square_location[1] - 1] is None or \
-                                        self._board[destination_square_location[0] + 1][
-                                            destination_square_location[1] - 1] != "Black" and \
-                                        self._board[destination_square_location[0] + 1][
-                                            destination_square_location[1] - 1] != "Black_king" and \
-                                        self._board[destination_square_location[0] + 1][
-                                            destination_square_location[1] - 1] != "Black_Triple_King" or \
-                                        self._board[destination_square_location[0] + 2][
-                                            destination_square_location[1] - 2] is not None:
-                                    self._white_turn += 1
-                                    return
-
-                            else:
-                                self._white_turn += 1
-                                return
-
-                # check last legal position, then proceed
-                if starting_square_location[0] + 1 <= 7 and starting_square_location[1] - 1 >= 0:
-                    if self._board[starting_square_location[0] + 1][starting_square_location[1] - 1] \
-                            == "Black" or \
-                            self._board[starting_square_location[0] + 1][starting_square_location[1] - 1] \
-                            == "Black_king" or \
-                            self._board[starting_square_location[0] + 1][starting_square_location[1] - 1] \
-                            == "Black_Triple_King":
-                        # if the space after enemy square is the destination, capture piece
-                        if destination_square_location[0] == starting_square_location[0] + 2 and \
-                                destination_square_location[1] == starting_square_location[1] - 2:
-                            self._board[starting_square_location[0] + 1][starting_square_location[1] - 1] = None
-                            self._white_capture += 1
-
-                        # check if another capture needs to happen. If not, turn +1
-                        if destination_square_location[0] + 2 <= 7 and destination_square_location[1] + 2 <= 7:
-                            if self._board[destination_square_location[0] + 1][
-                                destination_square_location[1] + 1] is None or \
-                                    self._board[destination_square_location[0] + 1][
-                                        destination_square_location[1] + 1] != "Black" and \
-                                    self._board[destination_square_location[0] + 1][
-                                        destination_square_location[1] + 1] != "Black_king" and \
-                                    self._board[destination_square_location[0] + 1][
-                                        destination_square_location[1] + 1] != "Black_Triple_King" or \
-                                    self._board[destination_square_location[0] + 2][
-                                        destination_square_location[1] + 2] is not None:
-                                self._white_turn += 1
-                                return
-
-                        if destination_square_location[0] + 2 <= 7:
-                            if self._board[destination_square_location[0] + 1][destination_square_location[1]] \
-                                    is None or \
-                                    self._board[destination_square_location[0] + 1][destination_square_location[1]] \
-                                    != "Black" and \
-                                    self._board[destination_square_location[0] + 1][destination_square_location[1]] \
-                                    != "Black_king" and \
-                                    self._board[destination_square_location[0] + 1][
-                                        destination_square_location[1]] != \
-                                    "Black_Triple_King" or \
-                                    self._board[destination_square_location[0] + 2][destination_square_location[1]] \
-                                    is not None:
-                                self._white_turn += 1
-                                return
-
-                        if destination_square_location[0] + 2 <= 7 and destination_square_location[1] - 2 >= 0:
-                            if self._board[destination_square_location[0] + 1][
-                                destination_square_location[1] - 1] is None or \
-                                    self._board[destination_square_location[0] + 1][
-                                        destination_square_location[1] - 1] != "Black" and \
-                                    self._board[destination_square_location[0] + 1][
-                                        destination_square_location[1] - 1] != "Black_king" and \
-                                    self._board[destination_square_location[0] + 1][
-                                        destination_square_location[1] - 1] != "Black_Triple_King" or \
-                                    self._board[destination_square_location[0] + 2][
-                                        destination_square_location[1] - 2] is not None:
-                                self._white_turn += 1
-                                return
-
-                        else:
-                            self._white_turn += 1
-                            return
-                    else:
-                        self._white_turn += 1
-                        return
-
-                else:
-                    # if there's no capture, + 1 turn
-                    self._white_turn += 1
-
-
-        def king_capture():
-            """If a king or triple king is the piece moving, check if it needs to make a capture"""
-            # Figure out whose turn it is
-            if self._player_1.get_player_name() == player_name:
-                player = self._player_1
-
-            elif self._player_2.get_player_name() == player_name:
-                player = self._player_2
-
-            def king_check_turn():
-                """If a king or triple king is moving, check for potential single capturing move"""
-                # check first potential move
-                if destination_square_location[0] - 2 >= 0 and destination_square_location[1] - 2 >= 0:
-                    if self._board[destination_square_location[0] - 1][destination_square_location[1] - 1] \
-                            is None or \
-                            self._board[destination_square_location[0] - 1][
-                                destination_square_location[1] - 1] == f"{player.get_checker_color()}" or \
-                            self._board[destination_square_location[0] - 1][
-                                destination_square_location[1] - 1] == f"{player.get_checker_color()}_king" or \
-                            self._board[destination_square_location[0] - 1][
-                                destination_square_location[1] - 1] == f"{player.get_checker_color()}_Triple_King" or \
-                            self._board[destination_square_location[0] - 2][
-                                destination_square_location[1] - 2] is not None:
-                        if player.get_checker_color() == "Black":
-                            self._black_turn += 1
-                            return
-                        elif player.get_checker_color() == "White":
-                            self._white_turn += 1
-                            return
-
-                # check second potential move
-                if destination_square_location[0] - 2 >= 0:
-                    if self._board[destination_square_location[0] - 1][
-                        destination_square_location[1]] is None or \
-                            self._board[destination_square_location[0] - 1][
-                                destination_square_location[1]] == f"{player.get_checker_color()}" or \
-                            self._board[destination_square_location[0] - 1][
-                                destination_square_location[1]] == f"{player.get_checker_color()}_king" or \
-                            self._board[destination_square_location[0] - 1][destination_square_location[
-                                1]] == f"{player.get_checker_color()}_Triple_King" or \
-                            self._board[destination_square_location[0] - 2][
-                                destination_square_location[1]] is not None:
-                        if player.get_checker_color() == "Black":
-                            self._black_turn += 1
-                            return
-                        elif player.get_checker_color() == "White":
-                            self._white_turn += 1
-                            return
-
-                # check third potential move
-                if destination_square_location[0] - 2 >= 0 and destination_square_location[1] + 2 <= 7:
-                    if self._board[destination_square_location[0] - 1][
-                        destination_square_location[1] - 1] is None or \
-                            self._board[destination_square_location[0] - 1][
-                                destination_square_location[1] - 1] == f"{player.get_checker_color()}" or \
-                            self._board[destination_square_location[0] - 1][
-                                destination_square_location[1] - 1] == f"{player.get_checker_color()}_king" or \
-                            self._board[destination_square_location[0] - 1][
-                                destination_square_location[1] - 1] == f"{player.get_checker_color()}_Triple_King" or \
-                            self._board[destination_square_location[0] - 2][
-                                destination_square_location[1] - 2] is not None:
-                        if player.get_checker_color() == "Black":
-                            self._black_turn += 1
-                            return
-                        elif player.get_checker_color() == "White":
-                            self._white_turn += 1
-                            return
-
-                # check fourth potential move
-                if destination_square_location[0] + 2 <= 7 and destination_square_location[1] + 2 <= 7:
-                    if self._board[destination_square_location[0] + 1][
-                        destination_square_location[1] + 1] is None or \
-                            self._board[destination_square_location[0] + 1][
-                                destination_square_location[1] + 1] == f"{player.get_checker_color()}" or \
-                            self._board[destination_square_location[0] + 1][
-                                destination_square_location[1] + 1] == f"{player.get_checker_color()}_king" or \
-                            self._board[destination_square_location[0] + 1][
-                                destination_square_location[1] + 1] == f"{player.get_checker_color()}_Triple_King" or \
-                            self._board[destination_square_location[0] + 2][
-                                destination_square_location[1] + 2] is not None:
-                        if player.get_checker_color() == "Black":
-                            self._black_turn += 1
-                            return
-                        elif player.get_checker_color() == "White":
-                            self._white_turn += 1
-                            return
-
-                # check fifth potential move
-                if destination_square_location[0] + 2 <= 7:
-                    if self._board[destination_square_location[0] + 1][
-                        destination_square_location[1]] is None or \
-                            self._board[destination_square_location[0] + 1][
-                                destination_square_location[1]] == f"{player.get_checker_color()}" or \
-                            self._board[destination_square_location[0] + 1][
-                                destination_square_location[1]] == f"{player.get_checker_color()}_king" or \
-                            self._board[destination_square_location[0] + 1][destination_square_location[
-                                1]] == f"{player.get_checker_color()}_Triple_King" or \
-                            self._board[destination_square_location[0] + 2][
-                                destination_square_location[1]] is not None:
-                        if player.get_checker_color() == "Black":
-                            self._black_turn += 1
-                            return
-                        elif player.get_checker_color() == "White":
-                            self._white_turn += 1
-                            return
-
-                    else:
-                        if player.get_checker_color() == "Black":
-                            return "Additional capture"
-                        elif player.get_checker_color() == "White":
-                            return "Additional capture"
-
-                #check sixth potential move
-                if destination_square_location[0] + 2 <= 7 and destination_square_location[1] - 2 >= 0:
-                    if self._board[destination_square_location[0] + 1][
-                        destination_square_location[1] - 1] is None or \
-                            self._board[destination_square_location[0] + 1][
-                                destination_square_location[1] - 1] == f"{player.get_checker_color()}" or \
-                            self._board[destination_square_location[0] + 1][
-                                destination_square_location[1] - 1] == f"{player.get_checker_color()}_king" or \
-                            self._board[destination_square_location[0] + 1][
-                                destination_square_location[1] - 1] == f"{player.get_checker_color()}_Triple_King" or \
-                            self._board[destination_square_location[0] + 2][
-                                destination_square_location[1] - 2] is not None:
-                        if player.get_checker_color() == "Black":
-                            self._black_turn += 1
-                            return
-                        elif player.get_checker_color() == "White":
-                            self._white_turn += 1
-                            return
-
-                    else:
-                        if player.get_checker_color() == "Black":
-                            return "Additional capture"
-                        elif player.get_checker_color() == "White":
-                            return "Additional capture"
-                # if none are true, + 1 turn
-                else:
-                    if player.get_checker_color() == "Black":
-                        self._black_turn += 1
-
-                    elif player.get_checker_color() == "White":
-                        self._white_turn += 1
-
-
-            # king_check_turn() ends here
-
-            # if the piece is a king or triple king, proceed
-            if self.get_checker_details(starting_square_location) == f"{player.get_checker_color()}_king" or \
-                    self.get_checker_details(starting_square_location) == f"{player.get_checker_color()}_Triple_King":
-
-                # Check first legal position, then proceed
-                if starting_square_location[0] - 1 >= 0 and starting_square_location[1] - 1 >= 0:
-                    if self._board[starting_square_location[0] - 1][starting_square_location[1] - 1] is not None and \
-                            self._board[starting_square_location[0] - 1][starting_square_location[1] - 1] \
-                            != f"{player.get_checker_color()}" and \
-                            self._board[starting_square_location[0] - 1][starting_square_location[1] - 1] \
-                            != f"{player.get_checker_color()}_king" and \
-                            self._board[starting_square_location[0] - 1][starting_square_location[1] - 1] \
-                            != f"{player.get_checker_color()}_Triple_King":
-                        # if the space after enemy square is the destination, capture piece
-                        if destination_square_location[0] == starting_square_location[0] - 2 \
-                                and destination_square_location[1] == starting_square_location[1] - 2:
-                            self._board[starting_square_location[0] - 1][starting_square_location[1] - 1] = None
-                            if player.get_checker_color() == "Black":
-                                self._black_capture += 1
-                            elif player.get_checker_color() == "White":
-                                self._white_capture += 1
-
-                            # check if another capture needs to happen. If not, turn +1
-                            first_check = king_check_turn()
-                            if first_check == "Additional capture":
-                                return
-
-                # check second legal position, then proceed
-                if starting_square_location[0] - 1 >= 0:
-                    if self._board[starting_square_location[0] - 1][starting_square_location[1]] is not None and \
-                            self._board[starting_square_location[0] - 1][
-                                starting_square_location[1]] != f"{player.get_checker_color()}" and \
-                            self._board[starting_square_location[0] - 1][
-                                starting_square_location[1]] != f"{player.get_checker_color()}_king" and \
-                            self._board[starting_square_location[0] - 1][
-                                starting_square_location[1]] != f"{player.get_checker_color()}_Triple_King":
-                        # if the space after enemy square is the destination, capture piece
-                        if destination_square_location[0] == starting_square_location[0] - 2 and \
-                                destination_square_location[1] == starting_square_location[1]:
-                            self._board[starting_square_location[0] - 1][starting_square_location[1]] = None
-                            if player.get_checker_color() == "Black":
-                                self._black_capture += 1
-                            elif player.get_checker_color() == "White":
-                                self._white_capture += 1
-
-                            # check if another capture needs to happen. If not, turn +1
-                            second_check = king_check_turn()
-                            if second_check == "Additional capture":
-                                return
-
-                            else:
-                                if player.get_checker_color() == "Black":
-                                    self._black_turn += 1
-                                    return
-                                elif player.get_checker_color() == "White":
-                                    self._white_turn += 1
-                                    return
-
-                # check third legal position, then proceed
-                if starting_square_location[0] - 1 >= 0 and starting_square_location[1] + 1 <= 7:
-                    if self._board[starting_square_location[0] - 1][starting_square_location[1] + 1] is not None and \
-                            self._board[starting_square_location[0] - 1][
-                                starting_square_location[1] + 1] != f"{player.get_checker_color()}" and \
-                            self._board[starting_square_location[0] - 1][
-                                starting_square_location[1] + 1] != f"{player.get_checker_color()}_king" and \
-                            self._board[starting_square_location[0] - 1][
-                                starting_square_location[1] + 1] != f"{player.get_checker_color()}_Triple_King":
-                        # if the space after enemy square is the destination, capture piece
-                        if destination_square_location[0] == starting_square_location[0] - 2 and \
-                                destination_square_location[1] == starting_square_location[1] + 2:
-                            self._board[starting_square_location[0] - 1][starting_square_location[1] + 1] = None
-                            if player.get_checker_color() == "Black":
-                                self._black_capture += 1
-                            elif player.get_checker_color() == "White":
-                                self._white_capture += 1
-
-                            # check if another capture needs to happen. If not, turn +1
-                            third_check = king_check_turn()
-                            if third_check == "Additional capture":
-                                return
-
-                            else:
-                                if player.get_checker_color() == "Black":
-                                    self._black_turn += 1
-                                    return
-                                elif player.get_checker_color() == "White":
-                                    self._white_turn += 1
-                                    return
-
-                # check fourth legal position, then proceed
-                if starting_square_location[0] + 1 <= 7 and starting_square_location[1] + 1 <= 7:
-                    if self._board[starting_square_location[0] + 1][starting_square_location[1] + 1] is not None and \
-                            self._board[starting_square_location[0] + 1][
-                                starting_square_location[1] + 1] != f"{player.get_checker_color()}" and \
-                            self._board[starting_square_location[0] + 1][
-                                starting_square_location[1] + 1] != f"{player.get_checker_color()}_king" and \
-                            self._board[starting_square_location[0] + 1][
-                                starting_square_location[1] + 1] != f"{player.get_checker_color()}_Triple_King":
-                        # if the space after enemy square is the destination, capture piece
-                        if destination_square_location[0] == starting_square_location[0] + 2 and \
-                                destination_square_location[1] == starting_square_location[1] + 2:
-                            self._board[starting_square_location[0] + 1][starting_square_location[1] + 1] = None
-                            if player.get_checker_color() == "Black":
-                                self._black_capture += 1
-
-                            elif player.get_checker_color() == "White":
-                                self._white_capture += 1
-
-                            # check if another capture needs to happen. If not, turn +1
-                            fourth_check = king_check_turn()
-                            if fourth_check == "Additional capture":
-                                return
-
-                            else:
-                                if player.get_checker_color() == "Black":
-                                    self._black_turn += 1
-                                    return
-                                elif player.get_checker_color() == "White":
-                                    self._white_turn += 1
-                                    return
-
-                # check fifth legal position, then proceed
-                if starting_square_location[0] + 1 <= 7:
-                    if self._board[starting_square_location[0] + 1][starting_square_location[1]] is not None and \
-                            self._board[starting_square_location[0] + 1][
-                                starting_square_location[1]] != f"{player.get_checker_color()}" and \
-                            self._board[starting_square_location[0] + 1][
-                                starting_square_location[1]] != f"{player.get_checker_color()}_king" and \
-                            self._board[starting_square_location[0] + 1][
-                                starting_square_location[1]] != f"{player.get_checker_color()}_Triple_King":
-                        # if the space after enemy square is the destination, capture piece
-                        if destination_square_location[0] == starting_square_location[0] + 2 and \
-                                destination_square_location[1] == starting_square_location[1]:
-                            self._board[starting_square_location[0] + 1][starting_square_location[1]] = None
-                            if player.get_checker_color() == "Black":
-                                self._black_capture += 1
-                            elif player.get_checker_color() == "White":
-                                self._white_capture += 1
-
-                            # check if another capture needs to happen. If not, turn +1
-                            fifth_check = king_check_turn()
-                            if fifth_check == "Additional capture":
-                                return
-
-                            else:
-                                if player.get_checker_color() == "Black":
-                                    self._black_turn += 1
-                                    return
-                                elif player.get_checker_color() == "White":
-                                    self._white_turn += 1
-                                    return
-
-                # check last legal position, then proceed
-                if starting_square_location[0] + 1 <= 7 and starting_square_location[1] - 1 >= 0:
-                    if self._board[starting_square_location[0] + 1][starting_square_location[1] - 1] is not None and \
-                            self._board[starting_square_location[0] + 1][
-                                starting_square_location[1] - 1] != f"{player.get_checker_color()}" and \
-                            self._board[starting_square_location[0] + 1][
-                                starting_square_location[1] - 1] != f"{player.get_checker_color()}_king" and \
-                            self._board[starting_square_location[0] + 1][
-                                starting_square_location[1] - 1] != f"{player.get_checker_color()}_Triple_King":
-                        # if the space after enemy square is the destination, capture piece
-                        if destination_square_location[0] == starting_square_location[0] + 2 and \
-                                destination_square_location[1] == starting_square_location[1] - 2:
-                            self._board[starting_square_location[0] + 1][starting_square_location[1] - 1] = None
-                            if player.get_checker_color() == "Black":
-                                self._black_capture += 1
-                            elif player.get_checker_color() == "White":
-                                self._white_capture += 1
-
-                            # check if another capture needs to happen. If not, turn +1
-                            sixth_check = king_check_turn()
-                            if sixth_check == "Additional capture":
-                                return
-
-                            else:
-                                if player.get_checker_color() == "Black":
-                                    self._black_turn += 1
-                                    return
-                                elif player.get_checker_color() == "White":
-                                    self._white_turn += 1
-                                    return
-
-                    else:
-                        if player.get_checker_color() == "Black":
-                            self._black_turn += 1
-                            return
-                        elif player.get_checker_color() == "White":
-                            self._white_turn += 1
-                            return
-
-                else:
-                    #if there's no capture, + 1 turn
-                    if player.get_checker_color() == "Black":
-                        self._black_turn += 1
-                    elif player.get_checker_color() == "White":
-                        self._white_turn += 1
-
-
-        def triple_king_leap():
-            """If the piece is a triple king, it can jump 2 spaces to kill enemies"""
-            # Figure out whose turn it is
-            if self._player_1.get_player_name() == player_name:
-                player = self._player_1
-
-            elif self._player_2.get_player_name() == player_name:
-                player = self._player_2
-
-            if self.get_checker_details(starting_square_location) == f"{player.get_checker_color()}_Triple_King":
-                pass
-
-
-        def piece_move():
-            """Finally, swap the position of the piece moving and its destination location"""
-
-           # Validate if piece needs to be turned into a King or Triple King
-            if destination_square_location[0] == 0:
-                if self.get_checker_details(starting_square_location) == "Black":
-                    self._board[destination_square_location[0]][destination_square_location[1]] = "Black_king"
-                    self._board[starting_square_location[0]][starting_square_location[1]] = None
-                elif self.get_checker_details(starting_square_location) == "White_king":
-                        self._board[destination_square_location[0]][destination_square_location[1]] = "White_Triple_King"
-                        self._board[starting_square_location[0]][starting_square_location[1]] = None
-
-            elif destination_square_location[0] == 7:
-                if self.get_checker_details(starting_square_location) == "White":
-                    self._board[destination_square_location[0]][destination_square_location[1]] = "White_king"
-                    self._board[starting_square_location[0]][starting_square_location[1]] = None
-                elif self.get_checker_details(starting_square_location) == "Black_king":
-                        self._board[destination_square_location[0]][destination_square_location[1]] = "Black_Triple_King"
-                        self._board[starting_square_location[0]][starting_square_location[1]] = None
+                return OutofTurn
 
+        # if it's white's turn, make sure the current player is playing white
+        else:
+            if player.get_checker_color() == "White":
+                # Because it's white's turn, the piece being moved must be white
+                if not self._white_pieces & start:
+                    return InvalidSquare
             else:
-                # If it passes the above, swap piece location with destination location.
-                self._board[starting_square_location[0]][starting_square_location[1]], \
-                    self._board[destination_square_location[0]][destination_square_location[1]] =\
-                    self._board[destination_square_location[0]][destination_square_location[1]], \
-                    self._board[starting_square_location[0]][starting_square_location[1]]
-
-        in_bounds()
-        validate_turn()
-        black_standard_capture()
-        white_standard_capture()
-        king_capture()
-        triple_king_leap()
-        piece_move()
+                return OutofTurn
+
+        return None
+
+    def _check_destination(self, piece, start_square, end_square):
+        """Check that the piece can reach the destination square: one step or one jump in a direction it moves in, and
+            only a jump over an enemy piece. Returns InvalidSquare if it can't, otherwise None. Uses the precomputed
+            masks, so it costs the same for any move."""
+        if not _DESTINATION_MASKS[piece][start_square] & (1 << end_square):
+            return InvalidSquare
+
+        jumped = _JUMPED_BITS[start_square][end_square]
+        if jumped and not (self._white_pieces if piece < Piece.WHITE else self._black_pieces) & jumped:
+            return InvalidSquare
+        return None
+
+    def _capture(self, start_square, end_square, directions, enemy_pieces):
+        """If the move jumps over an enemy piece in one of the directions given, remove the enemy piece and return
+            True"""
+        for direction in directions:
+            step_square, jump_square = _MOVE_TABLE[start_square][direction]
+            if jump_square == end_square:
+                captured = 1 << step_square
+                if not enemy_pieces & captured:
+                    return False
+
+                self._hash ^= _ZOBRIST_PIECE_KEYS[
+                    _piece_code(self._black_pieces, self._kings, self._triple_kings, captured)][step_square]
+                self._black_pieces &= ~captured
+                self._white_pieces &= ~captured
+                self._kings &= ~captured
+                self._triple_kings &= ~captured
+                return True
+        return False
+
+    def _black_standard_capture(self, start_square, end_square):
+        """Capture handler for a black man, which captures toward row 0"""
+        if self._capture(start_square, end_square, _BLACK_DIRECTIONS, self._white_pieces):
+            self._black_capture += 1
+            return True
+        return False
+
+    def _white_standard_capture(self, start_square, end_square):
+        """Capture handler for a white man, which captures toward row 7"""
+        if self._capture(start_square, end_square, _WHITE_DIRECTIONS, self._black_pieces):
+            self._white_capture += 1
+            return True
+        return False
+
+    def _black_king_capture(self, start_square, end_square):
+        """Capture handler for a black king or triple king, which capture in every direction. Triple kings have no
+            leap of their own yet, so they capture the same way kings do."""
+        if self._capture(start_square, end_square, _KING_DIRECTIONS, self._white_pieces):
+            self._black_capture += 1
+            return True
+        return False
+
+    def _white_king_capture(self, start_square, end_square):
+        """Capture handler for a white king or triple king, which capture in every direction"""
+        if self._capture(start_square, end_square, _KING_DIRECTIONS, self._black_pieces):
+            self._white_capture += 1
+            return True
+        return False
+
+    def _can_capture_again(self, end_square, directions, enemy_pieces):
+        """After a capture, check if the piece on the destination square has another capture available"""
+        occupied = self._black_pieces | self._white_pieces
+        for direction in directions:
+            step_square, jump_square = _MOVE_TABLE[end_square][direction]
+            if jump_square is not None and not occupied & (1 << jump_square) and enemy_pieces & (1 << step_square):
+                return True
+        return False
+
+    def _piece_move(self, piece, start_square, end_square):
+        """Finally, move the piece to its destination. Returns True if it was turned into a King or Triple King"""
+        start = 1 << start_square
+        end = 1 << end_square
+        move = start | end
+
+        # Validate if piece needs to be turned into a King or Triple King
+        promotion_row, promoted_piece = _PROMOTIONS[piece]
+        new_piece = promoted_piece if end & promotion_row else piece
+
+        # swap piece location with destination location in every bitboard the piece is in.
+        if piece < Piece.WHITE:
+            self._black_pieces ^= move
+        else:
+            self._white_pieces ^= move
+        rank = piece % 3
+        if rank == 1:
+            self._kings &= ~start
+        elif rank == 2:
+            self._triple_kings &= ~start
+        new_rank = new_piece % 3
+        if new_rank == 1:
+            self._kings |= end
+        elif new_rank == 2:
+            self._triple_kings |= end
+
+        self._hash ^= _ZOBRIST_PIECE_KEYS[piece][start_square] ^ _ZOBRIST_PIECE_KEYS[new_piece][end_square]
+        return new_piece != piece
+
+    def legal_moves(self, color):
+        """Generator of every legal move for the color given ("Black" or "White"). Each move is a tuple of square
+            locations, from the piece's starting square through every square it lands on, so a multi-jump can be
+            played one jump at a time with play_game. Captures are forced: if any capture is available, only
+            captures are generated. Stops as soon as the caller stops asking for moves."""
+        if color == "Black":
+            own_pieces, enemy_pieces = self._black_pieces, self._white_pieces
+            man_directions, king_row, triple_king_row = _BLACK_DIRECTIONS, _TOP_ROW, _BOTTOM_ROW
+        else:
+            own_pieces, enemy_pieces = self._white_pieces, self._black_pieces
+            man_directions, king_row, triple_king_row = _WHITE_DIRECTIONS, _BOTTOM_ROW, _TOP_ROW
+        empty_squares = _ALL_SQUARES & ~(own_pieces | enemy_pieces)
+
+        # Captures first, because if there are any the player has to take one
+        found_capture = False
+        pieces = own_pieces
+        while pieces:
+            bit = pieces & -pieces
+            pieces ^= bit
+            if self._kings & bit:
+                directions, promotion_row = _KING_DIRECTIONS, triple_king_row
+            elif self._triple_kings & bit:
+                directions, promotion_row = _KING_DIRECTIONS, 0
+            else:
+                directions, promotion_row = man_directions, king_row
+
+            for sequence in _jump_sequences([bit.bit_length() - 1], directions, enemy_pieces, empty_squares,
+                                            promotion_row):
+                found_capture = True
+                yield tuple(_SQUARE_LOCATIONS[square] for square in sequence)
+
+        if found_capture:
+            return
+
+        # No captures, so every single step onto an empty square is legal
+        pieces = own_pieces
+        while pieces:
+            bit = pieces & -pieces
+            pieces ^= bit
+            square = bit.bit_length() - 1
+            directions = _KING_DIRECTIONS if (self._kings | self._triple_kings) & bit else man_directions
+            for direction in directions:
+                step_square = _MOVE_TABLE[square][direction][0]
+                if step_square is not None and empty_squares & (1 << step_square):
+                    yield _SQUARE_LOCATIONS[square], _SQUARE_LOCATIONS[step_square]
+
+    def make_move(self, move):
+        """Plays a move from legal_moves straight onto the board, without any of the checks play_game makes, and
+            passes the turn. What changed is pushed onto the undo stack so unmake_move can take the move back, which
+            lets a search walk through positions without copying the game. The undo stack is a chain of
+            (undo record, rest of the stack) pairs ending in None, so forked games share the moves made before they
+            were forked."""
+        start = 1 << _SQUARES[move[0]]
+        end = 1 << _SQUARES[move[-1]]
+
+        # Every jump in the move captures the piece on the square it jumps over
+        captured = 0
+        for index in range(1, len(move)):
+            (from_row, from_column), (to_row, to_column) = move[index - 1], move[index]
+            if to_row - from_row in (-2, 2):
+                captured |= 1 << _SQUARES[((from_row + to_row) // 2, (from_column + to_column) // 2)]
+
+        # The undo record is the set of bits that flip in each bitboard, so applying it twice changes nothing.
+        #   It covers the moved piece, the captured pieces and any promotion.
+        is_black = bool(self._black_pieces & start)
+        if is_black:
+            black_change, white_change = start ^ end, captured
+            king_row, triple_king_row = _TOP_ROW, _BOTTOM_ROW
+        else:
+            black_change, white_change = captured, start ^ end
+            king_row, triple_king_row = _BOTTOM_ROW, _TOP_ROW
+        kings_change = captured & self._kings
+        triple_kings_change = captured & self._triple_kings
+
+        if self._kings & start:
+            if end & triple_king_row:
+                kings_change ^= start
+                triple_kings_change ^= end
+            else:
+                kings_change ^= start ^ end
+        elif self._triple_kings & start:
+            triple_kings_change ^= start ^ end
+        elif end & king_row:
+            kings_change ^= end
+
+        # The hash loses the keys of the moved and captured pieces where they stood, and gains the moved piece's key
+        #   where it lands. The side to move always changes.
+        hash_change = _ZOBRIST_BLACK_TO_MOVE ^ _ZOBRIST_PIECE_KEYS[
+            _piece_code(self._black_pieces, self._kings, self._triple_kings, start)][start.bit_length() - 1]
+        pieces = captured
+        while pieces:
+            bit = pieces & -pieces
+            pieces ^= bit
+            hash_change ^= _ZOBRIST_PIECE_KEYS[
+                _piece_code(self._black_pieces, self._kings, self._triple_kings, bit)][bit.bit_length() - 1]
+
+        self._black_pieces ^= black_change
+        self._white_pieces ^= white_change
+        self._kings ^= kings_change
+        self._triple_kings ^= triple_kings_change
+        hash_change ^= _ZOBRIST_PIECE_KEYS[
+            _piece_code(self._black_pieces, self._kings, self._triple_kings, end)][end.bit_length() - 1]
+        self._hash ^= hash_change
+
+        capture_count = captured.bit_count()
+        self._undo_stack = ((black_change, white_change, kings_change, triple_kings_change, hash_change, is_black,
+                             capture_count), self._undo_stack)
+        if is_black:
+            self._black_turn += 1
+            self._black_capture += capture_count
+        else:
+            self._white_turn += 1
+            self._white_capture += capture_count
+
+    def unmake_move(self):
+        """Takes back the last move played with make_move"""
+        if self._undo_stack is None:
+            raise IndexError("There is no move to take back")
+        (black_change, white_change, kings_change, triple_kings_change, hash_change, is_black, capture_count), \
+            self._undo_stack = self._undo_stack
+        self._black_pieces ^= black_change
+        self._white_pieces ^= white_change
+        self._kings ^= kings_change
+        self._triple_kings ^= triple_kings_change
+        self._hash ^= hash_change
+        if is_black:
+            self._black_turn -= 1
+            self._black_capture -= capture_count
+        else:
+            self._white_turn -= 1
+            self._white_capture -= capture_count
 
+    def get_piece(self, square_location):
+        """Returns the Piece code of the checker at the specified location, or None if no checker is present. This is
+            the integer form of get_checker_details."""
+        bit = _square_bit(square_location[0], square_location[1])
+        if not (self._black_pieces | self._white_pieces) & bit:
+            return None
+        return Piece(_piece_code(self._black_pieces, self._kings, self._triple_kings, bit))
 
     def get_checker_details(self, square_location):
         """Returns details of a checker at the specified location. If no checker is present, return None. If black is
             present, return “Black,” if white, return “White.” If kinged, returns format: “Black_king.” If
             triple kinged, returns 'Black_Triple_King.'"""
-        location = self._board[square_location[0]][square_location[1]]
+        location = self.get_board()[square_location[0]][square_location[1]]
         return location
 
     def get_board(self):
         """Get the board"""
-        return self._board
+        return _BoardView(self)
+
+    def fork(self):
+        """Returns a new game that branches off from this one: same position, players, counters and undo history,
+            and the same instrumentation sink, but no move recorder. Nothing is copied up front. The bitboards are
+            integers, so the fork shares them until it makes a move of its own, and the undo stacks share every move
+            made before the fork, so each fork only costs memory for what it changes. The fork can take back moves
+            from before it was made without affecting this game."""
+        game = Checkers.__new__(Checkers)
+        game._black_pieces = self._black_pieces
+        game._white_pieces = self._white_pieces
+        game._kings = self._kings
+        game._triple_kings = self._triple_kings
+        game._black_turn = self._black_turn
+        game._white_turn = self._white_turn
+        game._black_capture = self._black_capture
+        game._white_capture = self._white_capture
+        game._undo_stack = self._undo_stack
+        game._hash = self._hash
+        game._move_recorder = None
+        game._instrumentation = self._instrumentation
+        game._player_1 = None
+        game._player_2 = None
+        if self._player_1 is not None:
+            game._player_1 = Player(self._player_1.get_player_name(), self._player_1.get_checker_color(), game)
+        if self._player_2 is not None:
+            game._player_2 = Player(self._player_2.get_player_name(), self._player_2.get_checker_color(), game)
+        return game
+
+    def to_bytes(self):
+        """Returns a 64-byte snapshot of the game: the board, both players' names and colors, and the turn and
+            capture counters, which from_bytes turns back into a game. Player names can be at most 15 bytes of UTF-8.
+            The undo stack, move recorder and instrumentation are not kept."""
+        flags = 0
+        names = []
+        for number, player in enumerate((self._player_1, self._player_2)):
+            if player is None:
+                names.append(b"")
+                continue
+
+            name = player.get_player_name().encode()
+            if len(name) > _MAX_SNAPSHOT_NAME_BYTES or player.get_checker_color() not in ("Black", "White"):
+                raise ValueError("Snapshots need player names of at most 15 bytes and colors of Black or White")
+            names.append(name)
+            flags |= 1 << (2 * number)
+            if player.get_checker_color() == "White":
+                flags |= 2 << (2 * number)
+
+        return _SNAPSHOT.pack(_SNAPSHOT_VERSION, flags, self._black_turn, self._white_turn, self._black_capture,
+                              self._white_capture, self._black_pieces, self._white_pieces, self._kings,
+                              self._triple_kings, self._hash, *names)
+
+    @classmethod
+    def from_bytes(cls, snapshot):
+        """Returns a new game restored from a snapshot made by to_bytes"""
+        if len(snapshot) != _SNAPSHOT.size:
+            raise ValueError("A game snapshot is exactly 64 bytes")
+        version, flags, black_turn, white_turn, black_capture, white_capture, black_pieces, white_pieces, kings, \
+            triple_kings, position_hash, first_name, second_name = _SNAPSHOT.unpack(snapshot)
+        if version != _SNAPSHOT_VERSION:
+            raise ValueError("Unknown game snapshot version")
+
+        # Fill the game in directly rather than setting up a starting board only to replace it
+        game = cls.__new__(cls)
+        game._black_pieces = black_pieces
+        game._white_pieces = white_pieces
+        game._kings = kings
+        game._triple_kings = triple_kings
+        game._black_turn = black_turn
+        game._white_turn = white_turn
+        game._black_capture = black_capture
+        game._white_capture = white_capture
+        game._undo_stack = None
+        game._hash = position_hash
+        game._move_recorder = None
+        game._instrumentation = None
+        game._player_1 = None
+        game._player_2 = None
+        if flags & 1:
+            game._player_1 = Player(first_name.decode(), "White" if flags & 2 else "Black", game)
+        if flags & 4:
+            game._player_2 = Player(second_name.decode(), "White" if flags & 8 else "Black", game)
+        return game
 
 
     def print_board(self):
         """Print the current board, with current piece locations, in the form of an array."""
-        print(self._board)
+        print(self.get_board())
 
     def game_winner(self):
         """Returns the name of the player who won. If it hasn’t ended, returns “Game has not ended.” It will
             not check outcomes based on obscure victory conditions, like blocking all opponent pieces."""
-        if self._black_capture == 12:
-            if self._player_1.get_checker_color == "Black":
-                return self._player_1.get_player_name()
+        # A player wins once the other player has no pieces left
+        if not self._white_pieces:
+            winning_color = "Black"
+        elif not self._black_pieces:
+            winning_color = "White"
+        else:
+            return "Game has not ended"
 
-            elif self._player_2.get_checker_color == "Black":
-                return self._player._2.get_player_name()
+        if self._player_1 is not None and self._player_1.get_checker_color() == winning_color:
+            return self._player_1.get_player_name()
 
-        elif self._white_capture == 12:
-            if self._player_1.get_checker_color == "White":
-                return self._player_1.get_player_name()
+        elif self._player_2 is not None and self._player_2.get_checker_color() == winning_color:
+            return self._player_2.get_player_name()
 
-            elif self._player_2.get_checker_color == "White":
-                return self._player_2.get_player_name()
 
-        else:
-            return "Game has not ended"
+# The capture handler play_game runs for each Piece code, and the instrumentation phase it is timed under
+_CAPTURE_HANDLERS = (Checkers._black_standard_capture, Checkers._black_king_capture, Checkers._black_king_capture,
+                     Checkers._white_standard_capture, Checkers._white_king_capture, Checkers._white_king_capture)
+_CAPTURE_PHASES = ("standard_capture", "king_capture", "king_capture",
+                   "standard_capture", "king_capture", "king_capture")
 
 
 class Player:
     """Creates a player object through the Checkers class"""
 
+    __slots__ = ("_player_name", "_checker_color", "_entered_game")
+
     def __init__(self, player_name, checker_color, entered_game):
         self._player_name = player_name
         self._checker_color = checker_color
@@ -983,49 +939,19 @@ class Player:
 
     def get_king_count(self):
         """Returns the number of kings the specified player has."""
-        count = 0
-        for list in self._entered_game.get_board():
-            for element in list:
-                if element == f"{self._checker_color}_king":
-                    count += 1
-        return count
+        return self._entered_game.get_piece_counts(self._checker_color)[1]
 
     def get_triple_king_count(self):
         """Returns the number of triple king pieces the player has."""
-        count = 0
-        for list in self._entered_game.get_board():
-            for element in list:
-                if element == f"{self._checker_color}_Triple_King":
-                    count += 1
-        return count
+        return self._entered_game.get_piece_counts(self._checker_color)[2]
 
 
     def get_captured_pieces_count(self):
         """Returns the number of pieces the specified player has captured from the opponent."""
-        enemy_pieces_remaining = 0
         if self._checker_color == "Black":
-            for list in self._entered_game.get_board():
-                for element in list:
-                    if element == "White":
-                        enemy_pieces_remaining += 1
-
-                    elif element == "White_king":
-                        enemy_pieces_remaining += 1
-
-                    elif element == "White_Triple_King":
-                        enemy_pieces_remaining += 1
-
-        elif self._checker_color == "White":
-            for list in self._entered_game.get_board():
-                for element in list:
-                    if element == "Black":
-                        enemy_pieces_remaining += 1
-
-                    elif element == "Black_king":
-                        enemy_pieces_remaining += 1
-
-                    elif element == "Black_Triple_King":
-                        enemy_pieces_remaining += 1
+            enemy_pieces_remaining = sum(self._entered_game.get_piece_counts("White"))
+        else:
+            enemy_pieces_remaining = sum(self._entered_game.get_piece_counts("Black"))
 
         captured_count = (12 - enemy_pieces_remaining)
         return captured_count
@@ -1040,14 +966,14 @@ def main():
     joes_game.print_board()
 
     try:
-        joes_game.play_game("Bob", (7, 0), (0, 0))
-        print(joes_game.get_black_turn())
-        joes_game.play_game("Joe", (0, 1), (7, 1))
-        print(joes_game.get_white_turn())
-        joes_game.play_game("Bob", (0, 0), (7, 0))
+        joes_game.play_game("Bob", (5, 0), (4, 1))
+        joes_game.play_game("Joe", (2, 1), (3, 2))
+        joes_game.play_game("Bob", (5, 6), (4, 5))
+        joes_game.play_game("Joe", (2, 3), (3, 4))
+        joes_game.play_game("Bob", (4, 1), (2, 3))
         print(joes_game.get_black_turn())
         joes_game.print_board()
-        joes_game.play_game("Joe", (7, 1), (0, 1))
+        joes_game.play_game("Joe", (1, 4), (3, 2))
         print(joes_game.get_white_turn())
 
     except OutofTurn:
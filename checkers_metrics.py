@@ -0,0 +1,100 @@
+# Author: agent
+# GitHub username: agent
+# Date: 10/18/2026
+# Description: Sinks for the instrumentation Checkers.play_game reports through Checkers.set_instrumentation. A sink
+#   is any function called as sink(phase timings, error name) after each play_game call, so a plain callback works.
+#   HistogramSink keeps counts and histograms of the timings in memory, and JsonDumpSink does the same and writes
+#   them to a JSON file every so often for a metrics pipeline to pick up.
+
+import json
+import os
+import time
+
+
+# The phases of play_game, in the order they run. A jump runs either the standard capture phase (men) or the king
+#   capture phase (kings and triple kings), never both, and a single step runs neither.
+PHASES = ("in_bounds", "validate_turn", "check_destination", "standard_capture", "king_capture", "piece_move")
+
+
+class HistogramSink:
+    """Collects play_game instrumentation in memory: how many moves were played, how many of each exception were
+        raised, and for each phase how many times it ran, its total, fastest and slowest times, and a histogram of
+        its times in power-of-two nanosecond buckets. One sink can be shared by many games."""
+
+    def __init__(self):
+        self.reset()
+
+    def __call__(self, timings, error):
+        if error is None:
+            self._moves_processed += 1
+        else:
+            self._exception_counts[error] = self._exception_counts.get(error, 0) + 1
+
+        for phase, nanoseconds in timings.items():
+            phase_stats = self._phases.get(phase)
+            if phase_stats is None:
+                phase_stats = self._phases[phase] = [0, 0, nanoseconds, nanoseconds, {}]
+            phase_stats[0] += 1
+            phase_stats[1] += nanoseconds
+            phase_stats[2] = min(phase_stats[2], nanoseconds)
+            phase_stats[3] = max(phase_stats[3], nanoseconds)
+            # Bucket n holds times from 2 ** (n - 1) up to 2 ** n nanoseconds
+            bucket = nanoseconds.bit_length()
+            phase_stats[4][bucket] = phase_stats[4].get(bucket, 0) + 1
+
+    def get_moves_processed(self):
+        """Get how many play_game calls were played without an exception"""
+        return self._moves_processed
+
+    def get_exception_counts(self):
+        """Get a dict of how many times each exception was raised by play_game, by exception name"""
+        return dict(self._exception_counts)
+
+    def get_phase_summary(self, phase):
+        """Get a dict summing up one phase's timings: calls, total_ns, mean_ns, min_ns, max_ns and histogram (a dict
+            of how many times took up to each power of two nanoseconds), or None if the phase has never run"""
+        phase_stats = self._phases.get(phase)
+        if phase_stats is None:
+            return None
+        calls, total, fastest, slowest, buckets = phase_stats
+        return {"calls": calls, "total_ns": total, "mean_ns": total / calls, "min_ns": fastest, "max_ns": slowest,
+                "histogram": {1 << bucket: count for bucket, count in sorted(buckets.items())}}
+
+    def get_summary(self):
+        """Get everything collected so far as a dict ready to be written as JSON"""
+        return {"moves_processed": self._moves_processed,
+                "exceptions": self.get_exception_counts(),
+                "phases": {phase: self.get_phase_summary(phase) for phase in PHASES if phase in self._phases}}
+
+    def reset(self):
+        """Forget everything collected so far"""
+        self._moves_processed = 0
+        self._exception_counts = {}
+        # Per phase: [calls, total, fastest, slowest, {bucket: count}]
+        self._phases = {}
+
+
+class JsonDumpSink(HistogramSink):
+    """A HistogramSink that also writes its summary to a JSON file, at most once every interval seconds as moves come
+        in, and again whenever dump is called. The file is replaced in one step, so readers never see half of it."""
+
+    def __init__(self, path, interval=60.0):
+        super().__init__()
+        self._path = path
+        self._interval = interval
+        self._last_dump = time.monotonic()
+
+    def __call__(self, timings, error):
+        super().__call__(timings, error)
+        if time.monotonic() - self._last_dump >= self._interval:
+            self.dump()
+
+    def dump(self):
+        """Write the summary to the file now"""
+        self._last_dump = time.monotonic()
+        summary = self.get_summary()
+        summary["time"] = time.time()
+        temporary_path = self._path + ".tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(summary, file)
+        os.replace(temporary_path, self._path)
@@ -0,0 +1,92 @@
+# Author: agent
+# GitHub username: agent
+# Date: 10/18/2026
+# Description: Perft for the checkers game: counts the positions reached after exactly N moves from a position, by
+#   walking every sequence of moves from Checkers.legal_moves with make_move and unmake_move. The counts check move
+#   generation against known values and the time they take measures how fast moves are generated. divide breaks the
+#   count down by first move, and can hand the first moves out to worker processes for deep counts.
+
+import argparse
+import concurrent.futures
+import os
+import time
+
+from checkers_ai import side_to_move
+from checkers_game import Checkers
+
+
+def perft(game, depth):
+    """Returns how many positions are reached after exactly depth moves from the game's position. A position with no
+        moves before that depth counts for nothing. The game is left as it was."""
+    moves = list(game.legal_moves(side_to_move(game)))
+    # The moves themselves are the last layer of positions, so there is no need to play them
+    if depth <= 1:
+        return len(moves) if depth == 1 else 1
+
+    nodes = 0
+    for move in moves:
+        game.make_move(move)
+        nodes += perft(game, depth - 1)
+        game.unmake_move()
+    return nodes
+
+
+def _perft_after(bitboards, black_to_move, move, depth):
+    """Worker side: sets up the position, plays one first move and counts the rest of the tree below it"""
+    game = Checkers()
+    game.set_bitboards(*bitboards, black_to_move)
+    game.make_move(move)
+    return perft(game, depth - 1)
+
+
+def divide(game, depth, workers=1):
+    """Returns a list of (move, count) with the perft count below each first move. With more than 1 worker, the first
+        moves are split across that many worker processes."""
+    if depth < 1:
+        return []
+    moves = list(game.legal_moves(side_to_move(game)))
+    if workers == 1:
+        counts = []
+        for move in moves:
+            game.make_move(move)
+            counts.append(perft(game, depth - 1))
+            game.unmake_move()
+        return list(zip(moves, counts))
+
+    bitboards = game.get_bitboards()
+    black_to_move = side_to_move(game) == "Black"
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        counts = executor.map(_perft_after, [bitboards] * len(moves), [black_to_move] * len(moves), moves,
+                              [depth] * len(moves))
+        return list(zip(moves, counts))
+
+
+def main():
+    """Runs perft from the command line and prints the divide breakdown, the total and the nodes per second"""
+    parser = argparse.ArgumentParser(description="Count checkers positions N moves deep")
+    parser.add_argument("depth", type=int)
+    parser.add_argument("--workers", type=int, default=1, help="worker processes to split the first moves across "
+                                                               "(0 for the number of CPUs)")
+    parser.add_argument("--position", help="start from this position instead of the starting board, given as the "
+                                           "black, white, king and triple king bitboards in hex and the side to "
+                                           "move, such as 0x1000,0x100,0x1000,0,Black")
+    arguments = parser.parse_args()
+
+    game = Checkers()
+    if arguments.position:
+        *bitboards, color = arguments.position.split(",")
+        game.set_bitboards(*(int(bitboard, 16) for bitboard in bitboards), color == "Black")
+
+    started = time.perf_counter()
+    counts = divide(game, arguments.depth, arguments.workers or os.cpu_count() or 1)
+    elapsed = time.perf_counter() - started
+    for move, count in counts:
+        print(" ".join(f"{row},{column}" for row, column in move), count)
+
+    nodes = sum(count for move, count in counts)
+    print("Total:", nodes)
+    print(f"Time: {elapsed:.3f}s, {nodes / elapsed if elapsed else 0:.0f} nodes/second")
+
+
+if __name__ == "__main__":
+    main()
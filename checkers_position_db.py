@@ -0,0 +1,148 @@
+# Author: agent
+# GitHub username: agent
+# Date: 10/18/2026
+# Description: A read-only store of known checkers positions, such as opening book moves from the starting
+#   CheckersBoard or solved endgames. The file is a sorted array of position hashes (Checkers.position_hash) followed
+#   by an array of packed 32-bit values, and it is opened with mmap and searched in place with a binary search, so
+#   nothing is deserialized and every process that opens the same file shares one copy of it in the OS page cache.
+#
+#   File layout, in native byte order: the 8 bytes b"CKPD\x01\x00\x00\x00", the number of positions n as a 64-bit
+#   integer, n 64-bit position hashes in ascending order, then n 32-bit values in the same order.
+
+import array
+import bisect
+import mmap
+import sys
+
+from checkers_ai import best_move
+from checkers_ai import side_to_move
+from checkers_game import Checkers
+from checkers_game import square_number
+
+
+FILE_MAGIC = b"CKPD\x01\x00\x00\x00"
+_HEADER_BYTES = 16
+
+# Values are packed as a score in the low 16 bits (offset so it is never negative), the best move's start square in
+#   bits 16-20 and its final destination square in bits 21-25, and bit 26 set when there is a best move.
+_SCORE_OFFSET = 1 << 15
+_HAS_MOVE = 1 << 26
+
+
+def pack_value(score, move=None):
+    """Packs a score (clamped to 16 bits) and an optional best move, given as a tuple of square locations, into one
+        32-bit value"""
+    value = max(-_SCORE_OFFSET, min(_SCORE_OFFSET - 1, score)) + _SCORE_OFFSET
+    if move is not None:
+        value |= _HAS_MOVE | square_number(move[0]) << 16 | square_number(move[-1]) << 21
+    return value
+
+
+def unpack_score(value):
+    """Gets the score out of a packed value"""
+    return (value & 0xFFFF) - _SCORE_OFFSET
+
+
+def find_move(game, value):
+    """Gets the best move out of a packed value, as the legal move in the game that starts and ends on the stored
+        squares, or None if the value has no move or no legal move matches"""
+    if not value & _HAS_MOVE:
+        return None
+    start, destination = (value >> 16) & 0x1F, (value >> 21) & 0x1F
+    for move in game.legal_moves(side_to_move(game)):
+        if square_number(move[0]) == start and square_number(move[-1]) == destination:
+            return move
+    return None
+
+
+def write_position_db(path, entries):
+    """Writes a position store file from (position hash, packed value) pairs. If a hash appears more than once, the
+        last value given for it is kept."""
+    values_by_hash = dict(entries)
+    hashes = array.array("Q", sorted(values_by_hash))
+    values = array.array("I", (values_by_hash[position_hash] for position_hash in hashes))
+    with open(path, "wb") as file:
+        file.write(FILE_MAGIC)
+        file.write(array.array("Q", [len(hashes)]).tobytes())
+        file.write(hashes.tobytes())
+        file.write(values.tobytes())
+
+
+class PositionDB:
+    """A position store file opened read-only through mmap. Lookups binary search the hashes in place."""
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(FILE_MAGIC)] != FILE_MAGIC:
+            self._map.close()
+            raise ValueError("Not a checkers position store file")
+
+        count = int.from_bytes(self._map[len(FILE_MAGIC):_HEADER_BYTES], sys.byteorder)
+        if len(self._map) < _HEADER_BYTES + count * 12:
+            self._map.close()
+            raise ValueError("The position store file is shorter than its header says")
+
+        view = memoryview(self._map)
+        self._hashes = view[_HEADER_BYTES:_HEADER_BYTES + count * 8].cast("Q")
+        self._values = view[_HEADER_BYTES + count * 8:_HEADER_BYTES + count * 12].cast("I")
+
+    def __len__(self):
+        return len(self._hashes)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+    def lookup(self, position_hash):
+        """Get the packed value stored for a position hash, or None if the position isn't in the store"""
+        index = bisect.bisect_left(self._hashes, position_hash)
+        if index < len(self._hashes) and self._hashes[index] == position_hash:
+            return self._values[index]
+        return None
+
+    def lookup_game(self, game):
+        """Get the packed value stored for a game's current position, or None"""
+        return self.lookup(game.position_hash())
+
+    def close(self):
+        """Release the memory map"""
+        self._hashes.release()
+        self._values.release()
+        self._map.close()
+
+
+def opening_positions(plies):
+    """Generator of a Checkers game set to each distinct position reachable from the starting board in up to plies
+        moves. The same game object is yielded each time, moved to the next position, so copy anything needed from it
+        before asking for the next one."""
+    game = Checkers()
+    seen = set()
+
+    def walk(depth):
+        """Yields the current position if it is new, then every position below it"""
+        if game.position_hash() in seen:
+            return
+        seen.add(game.position_hash())
+        yield game
+        if depth == 0:
+            return
+        for move in list(game.legal_moves(side_to_move(game))):
+            game.make_move(move)
+            yield from walk(depth - 1)
+            game.unmake_move()
+
+    yield from walk(plies)
+
+
+def build_opening_book(path, plies=4, time_ms=100):
+    """Searches every position within plies moves of the starting board for time_ms milliseconds each and writes the
+        scores and best moves to a position store file. Scores are from the point of view of the side to move."""
+    entries = []
+    for game in opening_positions(plies):
+        result = best_move(game, time_ms)
+        entries.append((game.position_hash(), pack_value(result.get_score(), result.get_move())))
+    write_position_db(path, entries)
+    return len(entries)
@@ -0,0 +1,146 @@
+# Author: agent
+# GitHub username: agent
+# Date: 10/18/2026
+# Description: A compact binary format for archiving checkers games, with a writer that records games as they are
+#   played through Checkers.play_game and a reader that streams games back out of a file one at a time.
+#
+#   A file starts with the 4 bytes b"CKR1", followed by any number of games. Each game is:
+#     - its two players in the order they were created, each as a 1-byte name length, the UTF-8 name, and a color
+#       byte (0 for Black, 1 for White)
+#     - 2 bytes (little-endian) for each move accepted by play_game: the start square number in the low 5 bits and
+#       the destination square number in the next 5, with square numbers as given by checkers_game.square_number.
+#       A multi-jump takes one of these per jump, the same way it takes one play_game call per jump.
+#     - 0xFFFF to end the game.
+
+from checkers_game import Checkers
+from checkers_game import square_location
+from checkers_game import square_number
+
+
+FILE_MAGIC = b"CKR1"
+_END_OF_GAME = b"\xff\xff"
+_COLORS = ("Black", "White")
+
+
+class GameRecord:
+    """One archived game: the two players and every move played"""
+
+    def __init__(self, players, moves):
+        self._players = players
+        self._moves = moves
+
+    def get_players(self):
+        """Get the players as a list of (player name, piece color), in the order they were created"""
+        return self._players
+
+    def get_moves(self):
+        """Get the moves as a list of (start square number, destination square number)"""
+        return self._moves
+
+    def get_move_locations(self):
+        """Get the moves as a list of (start square location, destination square location), ready for play_game"""
+        return [(square_location(start), square_location(destination)) for start, destination in self._moves]
+
+    def replay(self):
+        """Generator that plays the game back through play_game on a new Checkers game, yielding the game after every
+            move. Raises the usual game exceptions if a move is no longer legal."""
+        game = Checkers()
+        names = {}
+        for player_name, piece_color in self._players:
+            game.create_player(player_name, piece_color)
+            names[piece_color] = player_name
+
+        for start, destination in self._moves:
+            color = "Black" if game.get_black_turn() <= game.get_white_turn() else "White"
+            game.play_game(names.get(color), square_location(start), square_location(destination))
+            yield game
+
+
+def _encode_players(players):
+    """Encodes the players part of a game"""
+    encoded = bytearray()
+    for player_name, piece_color in players:
+        name = player_name.encode()
+        if len(name) > 255:
+            raise ValueError("Player names can be at most 255 bytes long")
+        encoded.append(len(name))
+        encoded += name
+        encoded.append(_COLORS.index(piece_color))
+    return encoded
+
+
+class GameRecordWriter:
+    """Writes games to a binary file opened for writing. Games being played are attached to the writer, which records
+        their moves as play_game accepts them, and each game is written out in one piece when it is finished, so
+        many games can be recorded at the same time."""
+
+    def __init__(self, file):
+        self._file = file
+        self._recordings = {}
+        file.write(FILE_MAGIC)
+
+    def attach(self, game):
+        """Starts recording a game. Both of its players must already be created."""
+        players = [(player.get_player_name(), player.get_checker_color()) for player in game.get_players()]
+        recording = _encode_players(players)
+
+        def record_move(start, destination):
+            """Appends one move to the game's recording"""
+            recording.extend((start | destination << 5).to_bytes(2, "little"))
+
+        self._recordings[game] = recording
+        game.set_move_recorder(record_move)
+
+    def finish(self, game):
+        """Stops recording a game and writes it to the file"""
+        game.set_move_recorder(None)
+        recording = self._recordings.pop(game)
+        recording += _END_OF_GAME
+        self._file.write(recording)
+
+    def write_game(self, players, moves):
+        """Writes a game that has already been played. players is a list of (player name, piece color) in the order
+            they were created, and moves is a list of moves as returned by Checkers.legal_moves, where a multi-jump
+            lists every square the piece lands on."""
+        recording = _encode_players(players)
+        for move in moves:
+            for index in range(1, len(move)):
+                recording += (square_number(move[index - 1]) | square_number(move[index]) << 5).to_bytes(2, "little")
+        recording += _END_OF_GAME
+        self._file.write(recording)
+
+
+def read_games(file):
+    """Generator that reads games from a binary file opened for reading and yields a GameRecord for each, one at a
+        time, so a file of any size can be read without loading it into memory"""
+    if file.read(len(FILE_MAGIC)) != FILE_MAGIC:
+        raise ValueError("Not a checkers game record file")
+
+    while True:
+        players = []
+        for player_number in range(2):
+            length = file.read(1)
+            if not length and player_number == 0:
+                return
+            name = file.read(length[0] if length else 0)
+            color = file.read(1)
+            if not length or len(name) != length[0] or not color:
+                raise ValueError("The game record file ends in the middle of a game")
+            if color[0] >= len(_COLORS):
+                raise ValueError("The game record file has a piece color that is neither black nor white")
+            players.append((name.decode(), _COLORS[color[0]]))
+
+        moves = []
+        while True:
+            move = file.read(2)
+            if move == _END_OF_GAME:
+                break
+            if len(move) != 2:
+                raise ValueError("The game record file ends in the middle of a game")
+            value = move[0] | move[1] << 8
+            # Only the low 10 bits hold squares, so anything above them means the move is damaged
+            if value >> 10:
+                raise ValueError("The game record file has a move that is not between two squares")
+            moves.append((value & 0x1F, value >> 5))
+
+        yield GameRecord(players, moves)
@@ -0,0 +1,190 @@
+# Author: agent
+# GitHub username: agent
+# Date: 10/18/2026
+# Description: Hosts many checkers games at once from a single asyncio event loop. Games live in an in-memory registry
+#   keyed by game ID, and clients drive them over a local TCP or Unix socket with one JSON object per line. Every
+#   request gets one JSON reply line, and OutofTurn, InvalidSquare and InvalidPlayer come back as structured errors
+#   instead of closing the connection.
+#
+#   Requests look like {"op": "play_game", "game_id": "1", "player_name": "Bob", "from": [5, 0], "to": [4, 1]}, with an
+#   optional "id" that is copied into the reply. Operations: create_game, create_player (player_name, piece_color),
+#   play_game (player_name, from, to), get_board, game_winner and close_game. Replies are {"ok": true, ...} or
+#   {"ok": false, "error": "<error name>", "message": "..."}.
+
+import argparse
+import asyncio
+import itertools
+import json
+
+from checkers_game import Checkers
+from checkers_game import InvalidPlayer
+from checkers_game import InvalidSquare
+from checkers_game import OutofTurn
+
+
+class RequestError(Exception):
+    """A request that can't be carried out, reported back to the client by name"""
+
+    def __init__(self, error, message):
+        super().__init__(message)
+        self._error = error
+
+    def get_error(self):
+        """Get the error name sent to the client"""
+        return self._error
+
+
+# The game exceptions clients can get back, and what each means
+_GAME_ERRORS = {
+    OutofTurn: "It is not that player's turn",
+    InvalidSquare: "That piece can't move to that square",
+    InvalidPlayer: "That player is not in this game",
+}
+
+
+class GameServer:
+    """Keeps every hosted game in a registry by game ID and carries out client requests against them"""
+
+    def __init__(self):
+        self._games = {}
+        self._game_ids = itertools.count(1)
+
+    def get_game(self, game_id):
+        """Get the Checkers game with the ID given, or raise RequestError if there is none"""
+        game = self._games.get(game_id) if isinstance(game_id, str) else None
+        if game is None:
+            raise RequestError("UnknownGame", f"There is no game {game_id!r}")
+        return game
+
+    def get_game_count(self):
+        """Get how many games are being hosted"""
+        return len(self._games)
+
+    def handle_request(self, request):
+        """Carries out one request (a dict decoded from JSON) and returns the reply dict"""
+        reply = {}
+        if "id" in request:
+            reply["id"] = request["id"]
+
+        try:
+            reply.update(self._carry_out(request))
+        except RequestError as error:
+            reply.update(ok=False, error=error.get_error(), message=str(error))
+        except tuple(_GAME_ERRORS) as error:
+            reply.update(ok=False, error=type(error).__name__, message=_GAME_ERRORS[type(error)])
+        else:
+            reply["ok"] = True
+        return reply
+
+    def _carry_out(self, request):
+        """Runs the operation a request names and returns the fields of a successful reply"""
+        operation = request.get("op")
+
+        if operation == "create_game":
+            game_id = str(next(self._game_ids))
+            self._games[game_id] = Checkers()
+            return {"game_id": game_id}
+
+        game_id = request.get("game_id")
+        game = self.get_game(game_id)
+
+        if operation == "create_player":
+            player_name = request.get("player_name")
+            piece_color = request.get("piece_color")
+            if not isinstance(player_name, str) or piece_color not in ("Black", "White"):
+                raise RequestError("BadRequest", "create_player needs a player_name and a piece_color of "
+                                                 "\"Black\" or \"White\"")
+            players = game.get_players()
+            if None not in players:
+                raise RequestError("GameFull", "This game already has two players")
+            # Moves are matched to players by name, so a second player with the same name could never move
+            if any(player is not None and player.get_player_name() == player_name for player in players):
+                raise RequestError("BadRequest", f"There is already a player named {player_name!r} in this game")
+            game.create_player(player_name, piece_color)
+            return {}
+
+        if operation == "play_game":
+            if None in game.get_players():
+                raise RequestError("GameNotReady", "Both players have to join before moves can be played")
+            starting_square_location = _square_location(request.get("from"))
+            destination_square_location = _square_location(request.get("to"))
+            game.play_game(request.get("player_name"), starting_square_location, destination_square_location)
+            return {"black_turn": game.get_black_turn(), "white_turn": game.get_white_turn()}
+
+        if operation == "get_board":
+            return {"board": [list(row) for row in game.get_board()]}
+
+        if operation == "game_winner":
+            return {"winner": game.game_winner()}
+
+        if operation == "close_game":
+            del self._games[game_id]
+            return {}
+
+        raise RequestError("BadRequest", f"Unknown op {operation!r}")
+
+    async def handle_connection(self, reader, writer):
+        """Serves one client connection, replying to each JSON line it sends until it disconnects"""
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # The line is longer than the stream will buffer, so there is no telling where the next request
+                    #   starts. Say so and hang up.
+                    reply = {"ok": False, "error": "BadRequest", "message": "Request lines must be under 64 KiB"}
+                    writer.write(json.dumps(reply).encode() + b"\n")
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError
+                # Deeply nested JSON runs out of stack before it runs out of line
+                except (ValueError, RecursionError):
+                    reply = {"ok": False, "error": "BadRequest", "message": "Each line must be a JSON object"}
+                else:
+                    reply = self.handle_request(request)
+
+                writer.write(json.dumps(reply).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+def _square_location(value):
+    """Turns a [row, column] pair from a request into a square location tuple"""
+    if not isinstance(value, list) or len(value) != 2 or not all(type(number) is int for number in value):
+        raise RequestError("BadRequest", "Squares are given as [row, column]")
+    return value[0], value[1]
+
+
+async def serve(host="127.0.0.1", port=8765, unix_path=None, server=None):
+    """Runs a GameServer on a TCP port, or on a Unix socket if unix_path is given, until cancelled"""
+    if server is None:
+        server = GameServer()
+    if unix_path is not None:
+        listener = await asyncio.start_unix_server(server.handle_connection, path=unix_path)
+    else:
+        listener = await asyncio.start_server(server.handle_connection, host, port)
+    async with listener:
+        await listener.serve_forever()
+
+
+def main():
+    """Starts the server from the command line"""
+    parser = argparse.ArgumentParser(description="Host checkers games over a JSON-lines socket")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="serve on this Unix socket path instead of TCP")
+    arguments = parser.parse_args()
+    asyncio.run(serve(arguments.host, arguments.port, arguments.unix))
+
+
+if __name__ == "__main__":
+    main()
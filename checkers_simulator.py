@@ -0,0 +1,135 @@
+# Author: agent
+# GitHub username: agent
+# Date: 10/18/2026
+# Description: Plays many independent checkers games at once, spread across a pool of worker processes. Each game is
+#   played through Checkers.play_game with a policy choosing the moves, and results are handed back one game at a time
+#   as the workers finish them.
+
+import concurrent.futures
+import os
+import random
+
+from checkers_game import Checkers
+
+
+# Games that go on this many moves without a winner are stopped and counted as draws
+DEFAULT_MAX_MOVES = 200
+
+
+class GameResult:
+    """The outcome of one simulated game"""
+
+    def __init__(self, game_number, winner, moves, black_captures, white_captures, black_turns, white_turns):
+        self._game_number = game_number
+        self._winner = winner
+        self._moves = moves
+        self._black_captures = black_captures
+        self._white_captures = white_captures
+        self._black_turns = black_turns
+        self._white_turns = white_turns
+
+    def get_game_number(self):
+        """Get which game this was, from 0 to n - 1"""
+        return self._game_number
+
+    def get_winner(self):
+        """Get the winning color ("Black" or "White"), or None if the game was stopped as a draw"""
+        return self._winner
+
+    def get_moves(self):
+        """Get the list of moves played, each a tuple of square locations as returned by Checkers.legal_moves"""
+        return self._moves
+
+    def get_black_captures(self):
+        """Get how many pieces black captured"""
+        return self._black_captures
+
+    def get_white_captures(self):
+        """Get how many pieces white captured"""
+        return self._white_captures
+
+    def get_black_turns(self):
+        """Get how many turns black played"""
+        return self._black_turns
+
+    def get_white_turns(self):
+        """Get how many turns white played"""
+        return self._white_turns
+
+
+def random_policy(game, color, moves, rng):
+    """Policy that picks one of the legal moves at random"""
+    return rng.choice(moves)
+
+
+def play_one_game(policy, seed, max_moves=DEFAULT_MAX_MOVES):
+    """Plays one game with the policy choosing moves for both sides, and returns (winner, moves, black captures,
+        white captures, black turns, white turns). The policy is called as policy(game, color, moves, rng) and returns
+        one of the moves; rng is a random.Random seeded with seed, so the same seed replays the same game."""
+    rng = random.Random(seed)
+    game = Checkers()
+    black = game.create_player("Black", "Black")
+    white = game.create_player("White", "White")
+    played = []
+    winner = None
+
+    for move_number in range(max_moves):
+        color = "Black" if game.get_black_turn() <= game.get_white_turn() else "White"
+        moves = list(game.legal_moves(color))
+        # A player who can't move loses
+        if not moves:
+            winner = "White" if color == "Black" else "Black"
+            break
+
+        move = policy(game, color, moves, rng)
+        for index in range(1, len(move)):
+            game.play_game(color, move[index - 1], move[index])
+        played.append(move)
+
+    return (winner, played, black.get_captured_pieces_count(), white.get_captured_pieces_count(),
+            game.get_black_turn(), game.get_white_turn())
+
+
+def _play_games(policy, first_game, game_count, seed, max_moves):
+    """Worker side: plays a run of consecutive games and returns their results as plain tuples, which are cheap to
+        send back to the parent process"""
+    return [(game_number,) + play_one_game(policy, seed + game_number, max_moves)
+            for game_number in range(first_game, first_game + game_count)]
+
+
+def simulate_games(n, policy=random_policy, workers=None, seed=0, max_moves=DEFAULT_MAX_MOVES, chunk_size=None):
+    """Generator that plays n games across a pool of worker processes and yields a GameResult for each one as soon
+        as its worker is done, so results arrive in finishing order rather than game order. Game number i is played
+        with seed + i. The policy must be a module-level function (or something else that can be pickled), since it
+        is sent to the workers. workers defaults to the number of CPUs; with 1 worker the games are played in this
+        process. Games are handed to workers in chunks of chunk_size to keep the cost of talking to the workers low."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, min(64, n // (workers * 8)))
+
+    if workers == 1:
+        for first_game in range(0, n, chunk_size):
+            for result in _play_games(policy, first_game, min(chunk_size, n - first_game), seed, max_moves):
+                yield GameResult(*result)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        # Keep a few chunks per worker queued up, rather than submitting every chunk at once
+        chunk_starts = iter(range(0, n, chunk_size))
+        pending = set()
+        for first_game in chunk_starts:
+            pending.add(executor.submit(_play_games, policy, first_game, min(chunk_size, n - first_game), seed,
+                                        max_moves))
+            if len(pending) >= workers * 4:
+                break
+
+        while pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                first_game = next(chunk_starts, None)
+                if first_game is not None:
+                    pending.add(executor.submit(_play_games, policy, first_game, min(chunk_size, n - first_game),
+                                                seed, max_moves))
+                for result in future.result():
+                    yield GameResult(*result)
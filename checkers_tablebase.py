@@ -0,0 +1,449 @@
+# Author: agent
+# GitHub username: agent
+# Date: 10/18/2026
+# Description: Builds and reads endgame tablebases for this game's rules, which standard checkers databases can't
+#   cover because of triple kings. Every position with up to a given number of pieces per side (men, kings and triple
+#   kings in any mix) is solved by retrograde analysis as a win, loss or draw for the side to move, along with how
+#   many moves the game lasts with best play. A player who can't move loses.
+#
+#   Positions are grouped by material: how many men, kings and triple kings each side has. Within a group every
+#   position has its own slot in a byte array, worked out directly from where the pieces stand: the black men are
+#   ranked among the 28 squares a black man can be on, the white men among the 28 a white man can be on, and then
+#   each kind of king among the squares still free, with the side to move as the last bit. Layouts where the black
+#   and white men would share a square are the only unused slots. The move generation work for each group is split
+#   across worker processes, and groups are solved fewest pieces first so every capture and promotion leads to a
+#   group that is already solved.
+#
+#   File layout: the 8 bytes b"CKTB\x01\x00\x00\x00", the number of groups as 4 bytes, then for each group its 6 piece
+#   counts (black men, kings and triple kings, then white), 2 bytes of padding, and the offset and length of its
+#   table as 8 bytes each, followed by the tables. Numbers are little-endian. Each byte in a table is 0 for a draw,
+#   255 for an unused slot, or otherwise the number of moves (plies) left plus 1, which is even when the side to move
+#   wins.
+
+import argparse
+import array
+import concurrent.futures
+import itertools
+import math
+import mmap
+import os
+import struct
+import tempfile
+
+from checkers_game import Checkers
+
+
+FILE_MAGIC = b"CKTB\x01\x00\x00\x00"
+_HEADER = struct.Struct("<8sI")
+_DIRECTORY_ENTRY = struct.Struct("<6BxxQQ")
+
+DRAW = 0
+_UNUSED = 255
+# The longest distance a table byte can hold. Longer distances are stored as this or one less, whichever keeps
+#   whether the side to move wins or loses.
+_MAX_PLIES = 253
+
+_BINOMIAL = tuple(tuple(math.comb(n, k) for k in range(33)) for n in range(33))
+
+# The squares a black man can stand on (every row but row 0, where it would be kinged) and a white man can stand on
+#   (every row but row 7)
+_ALL_SQUARES = (1 << 32) - 1
+_BLACK_MEN_SQUARES = _ALL_SQUARES & ~0xF
+_WHITE_MEN_SQUARES = _ALL_SQUARES & ~(0xF << 28)
+
+_CHUNK_SIZE = 4096
+
+
+def get_signature(black_pieces, white_pieces, kings, triple_kings):
+    """Returns the material group of a position: (black men, black kings, black triple kings, white men, white kings,
+        white triple kings)"""
+    men = ~(kings | triple_kings)
+    return ((black_pieces & men).bit_count(), (black_pieces & kings).bit_count(),
+            (black_pieces & triple_kings).bit_count(), (white_pieces & men).bit_count(),
+            (white_pieces & kings).bit_count(), (white_pieces & triple_kings).bit_count())
+
+
+def _signatures(max_pieces):
+    """Returns every material group with 1 to max_pieces pieces per side, in the order they have to be solved: fewest
+        pieces first, and with the same number of pieces, the most promoted first"""
+    sides = [(men, kings, count - men - kings) for count in range(1, max_pieces + 1)
+             for men in range(count + 1) for kings in range(count - men + 1)]
+    signatures = [black + white for black in sides for white in sides]
+    signatures.sort(key=lambda signature: (sum(signature), -(signature[1] + signature[4]) -
+                                           2 * (signature[2] + signature[5])))
+    return signatures
+
+
+def _group_parts(signature, black_pieces=0, white_pieces=0, kings=0, triple_kings=0):
+    """Returns the parts a group's index is built from, in order, as (pieces on the board, squares they can be on,
+        how many of them there are)"""
+    black_men, black_kings, black_triple_kings, white_men, white_kings, white_triple_kings = signature
+    men = ~(kings | triple_kings)
+    return ((black_pieces & men, _BLACK_MEN_SQUARES, black_men),
+            (white_pieces & men, _WHITE_MEN_SQUARES, white_men),
+            (black_pieces & kings, _ALL_SQUARES, black_kings),
+            (black_pieces & triple_kings, _ALL_SQUARES, black_triple_kings),
+            (white_pieces & kings, _ALL_SQUARES, white_kings),
+            (white_pieces & triple_kings, _ALL_SQUARES, white_triple_kings))
+
+
+def _group_size(signature):
+    """Returns how many slots a material group's table has"""
+    size = 2
+    placed = 0
+    for index, (pieces, squares, count) in enumerate(_group_parts(signature)):
+        free_squares = squares.bit_count() if index < 2 else 32 - placed
+        size *= _BINOMIAL[free_squares][count]
+        placed += count
+    return size
+
+
+def _position_index(signature, black_pieces, white_pieces, kings, triple_kings, black_to_move):
+    """Returns a position's slot in its material group's table"""
+    index = 0
+    placed = 0
+    taken = 0
+    for part, (pieces, squares, count) in enumerate(_group_parts(signature, black_pieces, white_pieces, kings,
+                                                                 triple_kings)):
+        if part < 2:
+            free, free_count = squares, squares.bit_count()
+        else:
+            free, free_count = squares & ~taken, 32 - placed
+        placed += count
+        taken |= pieces
+
+        # Rank the set of squares with the combinatorial number system, numbering only the squares they could be on
+        rank = 0
+        number = 1
+        while pieces:
+            bit = pieces & -pieces
+            pieces ^= bit
+            rank += _BINOMIAL[(free & (bit - 1)).bit_count()][number]
+            number += 1
+        index = index * _BINOMIAL[free_count][count] + rank
+    return index * 2 + (0 if black_to_move else 1)
+
+
+def _unrank(rank, count, free):
+    """Returns the set of count squares, out of the free squares, with the rank given"""
+    squares = [square for square in range(32) if free >> square & 1]
+    pieces = 0
+    for number in range(count, 0, -1):
+        position = number - 1
+        while _BINOMIAL[position + 1][number] <= rank:
+            position += 1
+        rank -= _BINOMIAL[position][number]
+        pieces |= 1 << squares[position]
+    return pieces
+
+
+def _position_at(signature, index):
+    """Returns the (black pieces, white pieces, kings, triple kings, black to move) of a group's slot, or None for an
+        unused slot"""
+    black_to_move = index % 2 == 0
+    index //= 2
+    parts = _group_parts(signature)
+
+    # Peel the ranks off the index, last part first
+    ranks = []
+    placed = sum(count for pieces, squares, count in parts)
+    for part in range(5, -1, -1):
+        count = parts[part][2]
+        placed -= count
+        free_count = parts[part][1].bit_count() if part < 2 else 32 - placed
+        index, rank = divmod(index, _BINOMIAL[free_count][count])
+        ranks.append(rank)
+    ranks.reverse()
+
+    black_men = _unrank(ranks[0], parts[0][2], _BLACK_MEN_SQUARES)
+    white_men = _unrank(ranks[1], parts[1][2], _WHITE_MEN_SQUARES)
+    if black_men & white_men:
+        return None
+
+    taken = black_men | white_men
+    placed_pieces = []
+    for part in range(2, 6):
+        pieces = _unrank(ranks[part], parts[part][2], _ALL_SQUARES & ~taken)
+        taken |= pieces
+        placed_pieces.append(pieces)
+    black_kings, black_triple_kings, white_kings, white_triple_kings = placed_pieces
+    return (black_men | black_kings | black_triple_kings, white_men | white_kings | white_triple_kings,
+            black_kings | white_kings, black_triple_kings | white_triple_kings, black_to_move)
+
+
+# Solved tables the worker has read, by (directory, signature)
+_loaded_tables = {}
+
+
+def _table_value(directory, black_pieces, white_pieces, kings, triple_kings, black_to_move):
+    """Returns the table byte of a position in an already solved group, read from the directory it was saved in"""
+    if not (black_pieces if black_to_move else white_pieces):
+        return 1
+    signature = get_signature(black_pieces, white_pieces, kings, triple_kings)
+    table = _loaded_tables.get((directory, signature))
+    if table is None:
+        with open(os.path.join(directory, _table_file_name(signature)), "rb") as file:
+            table = _loaded_tables[directory, signature] = file.read()
+    return table[_position_index(signature, black_pieces, white_pieces, kings, triple_kings, black_to_move)]
+
+
+def _table_file_name(signature):
+    """Returns the name a solved group's table is saved under while the tablebase is being built"""
+    return "".join(str(count) for count in signature) + ".bin"
+
+
+def _expand_chunk(directory, signature, start, stop):
+    """Worker side: generates the moves of every position in a run of a group's slots. Moves into other groups are
+        looked up in their solved tables and summed up per position; moves within the group are returned as edges
+        for the retrograde pass. Returns (unused slots, positions with no moves, best win through another group,
+        longest loss through another group, draws through another group, edge starts, edge ends), with the
+        per-position values as arrays over the run and 0 meaning none."""
+    game = Checkers()
+    unused = bytearray(stop - start)
+    no_moves = bytearray(stop - start)
+    outside_wins = array.array("H", bytes(2 * (stop - start)))
+    outside_losses = array.array("H", bytes(2 * (stop - start)))
+    outside_draws = bytearray(stop - start)
+    edge_starts = array.array("I")
+    edge_ends = array.array("I")
+
+    for index in range(start, stop):
+        position = _position_at(signature, index)
+        if position is None:
+            unused[index - start] = 1
+            continue
+
+        black_to_move = position[4]
+        game.set_bitboards(*position)
+        moves = list(game.legal_moves("Black" if black_to_move else "White"))
+        if not moves:
+            no_moves[index - start] = 1
+            continue
+
+        for move in moves:
+            game.make_move(move)
+            black_pieces, white_pieces, kings, triple_kings = game.get_bitboards()
+            game.unmake_move()
+
+            if get_signature(black_pieces, white_pieces, kings, triple_kings) == signature:
+                edge_starts.append(index)
+                edge_ends.append(_position_index(signature, black_pieces, white_pieces, kings, triple_kings,
+                                                 not black_to_move))
+                continue
+
+            value = _table_value(directory, black_pieces, white_pieces, kings, triple_kings, not black_to_move)
+            if value == DRAW:
+                outside_draws[index - start] = 1
+            elif value % 2 == 1:
+                # The other side loses there, so this side wins one move later
+                if not outside_wins[index - start] or value + 1 < outside_wins[index - start]:
+                    outside_wins[index - start] = value + 1
+            else:
+                outside_losses[index - start] = max(outside_losses[index - start], value + 1)
+
+    return unused, no_moves, outside_wins, outside_losses, outside_draws, edge_starts, edge_ends
+
+
+def _stored_value(plies):
+    """Returns the table byte for a result decided in plies moves"""
+    if plies > _MAX_PLIES:
+        plies = _MAX_PLIES if plies % 2 == _MAX_PLIES % 2 else _MAX_PLIES - 1
+    return plies + 1
+
+
+def _solve_group(directory, signature, executor):
+    """Solves one material group and returns its table"""
+    size = _group_size(signature)
+    unused = bytearray()
+    no_moves = bytearray()
+    outside_wins = array.array("H")
+    outside_losses = array.array("H")
+    outside_draws = bytearray()
+    edge_starts = array.array("I")
+    edge_ends = array.array("I")
+
+    chunks = [(directory, signature, start, min(start + _CHUNK_SIZE, size)) for start in range(0, size, _CHUNK_SIZE)]
+    if executor is None:
+        results = itertools.starmap(_expand_chunk, chunks)
+    else:
+        results = executor.map(_expand_chunk, *zip(*chunks))
+    for result in results:
+        unused += result[0]
+        no_moves += result[1]
+        outside_wins += result[2]
+        outside_losses += result[3]
+        outside_draws += result[4]
+        edge_starts += result[5]
+        edge_ends += result[6]
+
+    # Index the edges by where they end, so each solved position can find the positions that move into it
+    offsets = array.array("I", bytes(4 * (size + 1)))
+    for end in edge_ends:
+        offsets[end + 1] += 1
+    for index in range(size):
+        offsets[index + 1] += offsets[index]
+    predecessors = array.array("I", bytes(4 * len(edge_ends)))
+    filled = array.array("I", offsets[:size])
+    moves_left = array.array("I", bytes(4 * size))
+    for start, end in zip(edge_starts, edge_ends):
+        predecessors[filled[end]] = start
+        filled[end] += 1
+        moves_left[start] += 1
+
+    # Work outward from the positions decided soonest. buckets[plies] holds positions that may be decided in that
+    #   many moves; a position is final the first time it comes out of a bucket.
+    table = bytearray(size)
+    solved = bytearray(size)
+    buckets = [[]]
+
+    def add(index, plies):
+        """Puts a position in the bucket for a result in plies moves"""
+        while len(buckets) <= plies:
+            buckets.append([])
+        buckets[plies].append(index)
+
+    longest_loss = array.array("H", outside_losses)
+    for index in range(size):
+        if unused[index]:
+            table[index] = _UNUSED
+            solved[index] = 1
+        elif no_moves[index]:
+            add(index, 0)
+        elif outside_wins[index]:
+            add(index, outside_wins[index] - 1)
+        elif not moves_left[index] and not outside_draws[index]:
+            add(index, outside_losses[index] - 1)
+
+    plies = 0
+    while plies < len(buckets):
+        for index in buckets[plies]:
+            if solved[index]:
+                continue
+            solved[index] = 1
+            table[index] = _stored_value(plies)
+
+            for predecessor in predecessors[offsets[index]:offsets[index + 1]]:
+                if solved[predecessor]:
+                    continue
+                if plies % 2 == 0:
+                    # This position is lost for the side to move, so moving into it wins
+                    add(predecessor, plies + 1)
+                else:
+                    longest_loss[predecessor] = max(longest_loss[predecessor], plies + 2)
+                    moves_left[predecessor] -= 1
+                    if not moves_left[predecessor] and not outside_draws[predecessor] and \
+                            not outside_wins[predecessor]:
+                        add(predecessor, longest_loss[predecessor] - 1)
+        buckets[plies] = None
+        plies += 1
+
+    # Anything never decided can be held forever by both sides, so it is a draw (already 0 in the table)
+    return table
+
+
+def generate_tablebase(path, max_pieces=1, workers=None):
+    """Solves every position with 1 to max_pieces pieces per side and writes the tablebase file. Move generation is
+        split across workers processes (the number of CPUs by default; with 1 everything runs in this process).
+        Returns how many positions the tablebase holds, not counting unused slots. The cost climbs steeply with
+        max_pieces: on one core, 1 piece per side is 16,448 slots and takes a couple of seconds, while 2 pieces per
+        side is 31,254,440 slots (a file of about 31 MB) and takes about an hour and 200 MB of memory."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    signatures = _signatures(max_pieces)
+
+    with tempfile.TemporaryDirectory() as directory:
+        executor = None if workers == 1 else concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        try:
+            for signature in signatures:
+                table = _solve_group(directory, signature, executor)
+                with open(os.path.join(directory, _table_file_name(signature)), "wb") as file:
+                    file.write(table)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            for key in [key for key in _loaded_tables if key[0] == directory]:
+                del _loaded_tables[key]
+
+        # Put every table together in one file behind a directory of where each one starts
+        offset = _HEADER.size + _DIRECTORY_ENTRY.size * len(signatures)
+        positions = 0
+        with open(path, "wb") as file:
+            file.write(_HEADER.pack(FILE_MAGIC, len(signatures)))
+            for signature in signatures:
+                size = _group_size(signature)
+                file.write(_DIRECTORY_ENTRY.pack(*signature, offset, size))
+                offset += size
+            for signature in signatures:
+                with open(os.path.join(directory, _table_file_name(signature)), "rb") as table_file:
+                    table = table_file.read()
+                file.write(table)
+                positions += len(table) - table.count(_UNUSED)
+    return positions
+
+
+class Tablebase:
+    """A tablebase file opened read-only through mmap. A probe works out the position's slot from where its pieces
+        stand and reads one byte, so it takes the same time however big the tablebase is."""
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, group_count = _HEADER.unpack_from(self._map)
+        if magic != FILE_MAGIC:
+            self._map.close()
+            raise ValueError("Not a checkers tablebase file")
+
+        self._offsets = {}
+        for group in range(group_count):
+            entry = _DIRECTORY_ENTRY.unpack_from(self._map, _HEADER.size + group * _DIRECTORY_ENTRY.size)
+            self._offsets[entry[:6]] = entry[6]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+    def get_signatures(self):
+        """Get the material groups the tablebase covers"""
+        return list(self._offsets)
+
+    def probe_bitboards(self, black_pieces, white_pieces, kings, triple_kings, black_to_move):
+        """Look up a position given by its bitboards. Returns ("Win", plies), ("Loss", plies) or ("Draw", None) for
+            the side to move, or None if the tablebase doesn't cover the position."""
+        signature = get_signature(black_pieces, white_pieces, kings, triple_kings)
+        offset = self._offsets.get(signature)
+        if offset is None:
+            return None
+
+        value = self._map[offset + _position_index(signature, black_pieces, white_pieces, kings, triple_kings,
+                                                   black_to_move)]
+        if value == DRAW:
+            return "Draw", None
+        if value == _UNUSED:
+            return None
+        return ("Loss" if value % 2 == 1 else "Win"), value - 1
+
+    def probe(self, game):
+        """Look up a game's current position, with the side to move taken from its turn counters"""
+        return self.probe_bitboards(*game.get_bitboards(), game.get_black_turn() <= game.get_white_turn())
+
+    def close(self):
+        """Release the memory map"""
+        self._map.close()
+
+
+def main():
+    """Builds a tablebase from the command line"""
+    parser = argparse.ArgumentParser(description="Build a checkers endgame tablebase")
+    parser.add_argument("path")
+    parser.add_argument("--pieces", type=int, default=1,
+                        help="most pieces per side (2 takes about an hour on one core)")
+    parser.add_argument("--workers", type=int, help="worker processes (defaults to the number of CPUs)")
+    arguments = parser.parse_args()
+    positions = generate_tablebase(arguments.path, arguments.pieces, arguments.workers)
+    print(positions, "positions,", os.path.getsize(arguments.path), "bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,46 @@
 
+import asyncio
+import io
+import json
+import os
+import tempfile
 import unittest
 
 from CheckersGame import CheckersBoard
 from CheckersGame import Checkers
 from CheckersGame import Player
+from CheckersGame import Piece
+from CheckersGame import OutofTurn
+from CheckersGame import InvalidSquare
+from checkers_ai import best_move
+from checkers_ai import TranspositionTable
+from checkers_ai import EXACT
+from checkers_ai import EvaluationCache
+from checkers_ai import parallel_best_move
+from checkers_ai import ParallelSearcher
+from checkers_ai import transposition_table_bytes
+from checkers_ai import evaluate
+from checkers_batch_eval import pack_positions
+from checkers_batch_eval import batch_features
+from checkers_batch_eval import batch_evaluate
+from checkers_simulator import simulate_games
+from checkers_server import GameServer
+from checkers_records import GameRecord
+from checkers_records import GameRecordWriter
+from checkers_records import read_games
+from checkers_position_db import PositionDB
+from checkers_position_db import write_position_db
+from checkers_position_db import pack_value
+from checkers_position_db import unpack_score
+from checkers_position_db import find_move
+from checkers_tablebase import generate_tablebase
+from checkers_benchmark import compare_results
+from checkers_benchmark import run_benchmarks
+from checkers_perft import perft
+from checkers_perft import divide
+from checkers_metrics import HistogramSink
+from checkers_validator import validate_games
+from checkers_tablebase import Tablebase
 
 
 class TestStandardMoves(unittest.TestCase):
@@ -72,6 +109,26 @@ class TestStandardMoves(unittest.TestCase):
         self.assertIs(joes_game.get_checker_details((2, 3)), None)
         self.assertEqual(joe.get_captured_pieces_count(), 1)
 
+    def test_5(self):
+        """Make sure a player keeps the turn while their piece has another jump to make"""
+        joes_game = Checkers()
+
+        joe = joes_game.create_player("Joe", "White")
+        bob = joes_game.create_player("Bob", "Black")
+        # A black man on (5, 0) with white men on (4, 1) and (2, 3) lined up for a double jump
+        joes_game.set_bitboards(1 << 20, 1 << 16 | 1 << 9, 0, 0)
+
+        joes_game.play_game("Bob", (5, 0), (3, 2))
+        self.assertEqual(joes_game.get_black_turn(), 0)
+        with self.assertRaises(OutofTurn):
+            joes_game.play_game("Joe", (2, 3), (3, 4))
+
+        joes_game.play_game("Bob", (3, 2), (1, 4))
+        self.assertEqual(joes_game.get_black_turn(), 1)
+        self.assertIs(joes_game.get_checker_details((4, 1)), None)
+        self.assertIs(joes_game.get_checker_details((2, 3)), None)
+
+
 class TestKingMove(unittest.TestCase):
     """Test to make sure kings for both colors work"""
 
@@ -81,12 +138,14 @@ class TestKingMove(unittest.TestCase):
 
         joe = joes_game.create_player("Joe", "White")
         bob = joes_game.create_player("Bob", "Black")
+        # A black man on (1, 0) and a white man on (6, 1), each one step from being kinged
+        joes_game.set_bitboards(1 << 4, 1 << 24, 0, 0)
 
-        joes_game.play_game("Bob", (7, 0), (0, 0))
-        joes_game.play_game("Joe", (0, 1), (7, 1))
+        joes_game.play_game("Bob", (1, 0), (0, 1))
+        joes_game.play_game("Joe", (6, 1), (7, 0))
         joes_game.print_board()
-        self.assertEqual(joes_game.get_checker_details((0, 0)), "Black_king")
-        self.assertEqual(joes_game.get_checker_details((7, 1)), "White_king")
+        self.assertEqual(joes_game.get_checker_details((0, 1)), "Black_king")
+        self.assertEqual(joes_game.get_checker_details((7, 0)), "White_king")
 
     def test_2(self):
         """Test to make sure triple kings for both colors work"""
@@ -94,20 +153,629 @@ class TestKingMove(unittest.TestCase):
 
         joe = joes_game.create_player("Joe", "White")
         bob = joes_game.create_player("Bob", "Black")
+        # A black king on (6, 3) and a white king on (1, 2), each one step from the far side of the board
+        joes_game.set_bitboards(1 << 25, 1 << 5, 1 << 25 | 1 << 5, 0)
         joes_game.print_board()
 
-        joes_game.play_game("Bob", (7, 0), (0, 0))
-        print(joes_game.get_black_turn())
-        joes_game.play_game("Joe", (0, 1), (7, 1))
-        print(joes_game.get_white_turn())
-        joes_game.play_game("Bob", (0, 0), (7, 0))
+        joes_game.play_game("Bob", (6, 3), (7, 2))
         print(joes_game.get_black_turn())
-        joes_game.print_board()
-        joes_game.play_game("Joe", (7, 1), (0, 1))
+        joes_game.play_game("Joe", (1, 2), (0, 3))
         print(joes_game.get_white_turn())
 
-        self.assertEqual(joes_game.get_checker_details((7, 0)), "Black_Triple_King")
-        self.assertEqual(joes_game.get_checker_details((0, 1)), "White_Triple_King")
+        self.assertEqual(joes_game.get_checker_details((7, 2)), "Black_Triple_King")
+        self.assertEqual(joes_game.get_checker_details((0, 3)), "White_Triple_King")
+
+
+class TestPieceCounts(unittest.TestCase):
+    """Test the piece counts and the winner check"""
+
+    def test_1(self):
+        """Test that piece counts follow captures and promotions"""
+        joes_game = Checkers()
+
+        joe = joes_game.create_player("Joe", "White")
+        bob = joes_game.create_player("Bob", "Black")
+        joes_game.set_bitboards(1 << 4 | 1 << 20 | 1 << 21, 1 << 24 | 1 << 9, 0, 0)
+
+        joes_game.play_game("Bob", (1, 0), (0, 1))
+        self.assertEqual(joes_game.get_piece_counts("Black"), (2, 1, 0))
+        self.assertEqual(bob.get_king_count(), 1)
+        self.assertEqual(joes_game.game_winner(), "Game has not ended")
+
+    def test_2(self):
+        """Test that the integer piece codes agree with the piece names"""
+        joes_game = Checkers()
+
+        joe = joes_game.create_player("Joe", "White")
+        bob = joes_game.create_player("Bob", "Black")
+        joes_game.set_bitboards(1 << 4 | 1 << 20 | 1 << 21, 1 << 24 | 1 << 9, 0, 0)
+
+        joes_game.play_game("Bob", (1, 0), (0, 1))
+        self.assertEqual(joes_game.get_piece((0, 1)), Piece.BLACK_KING)
+        self.assertEqual(joes_game.get_piece((6, 1)), Piece.WHITE)
+        self.assertIs(joes_game.get_piece((4, 3)), None)
+
+
+class TestLegalMoves(unittest.TestCase):
+    """Test the legal move generator"""
+
+    def test_1(self):
+        """Test that black has seven opening moves, all single steps forward"""
+        joes_game = Checkers()
+
+        moves = list(joes_game.legal_moves("Black"))
+        self.assertEqual(len(moves), 7)
+        self.assertIn(((5, 0), (4, 1)), moves)
+
+    def test_2(self):
+        """Test that captures are forced once one is available"""
+        joes_game = Checkers()
+
+        joe = joes_game.create_player("Joe", "White")
+        bob = joes_game.create_player("Bob", "Black")
+
+        joes_game.play_game("Bob", (5, 0), (4, 1))
+        joes_game.play_game("Joe", (2, 1), (3, 2))
+        joes_game.play_game("Bob", (5, 6), (4, 5))
+        joes_game.play_game("Joe", (2, 3), (3, 4))
+
+        self.assertEqual(sorted(joes_game.legal_moves("Black")), [((4, 1), (2, 3)), ((4, 5), (2, 3))])
+
+
+class TestMakeMove(unittest.TestCase):
+    """Test make_move and unmake_move"""
+
+    def test_1(self):
+        """Test that a capture made with make_move is fully taken back by unmake_move"""
+        joes_game = Checkers()
+
+        joe = joes_game.create_player("Joe", "White")
+        bob = joes_game.create_player("Bob", "Black")
+
+        joes_game.play_game("Bob", (5, 0), (4, 1))
+        joes_game.play_game("Joe", (2, 1), (3, 2))
+        joes_game.play_game("Bob", (5, 6), (4, 5))
+        joes_game.play_game("Joe", (2, 3), (3, 4))
+        board_before = [list(row) for row in joes_game.get_board()]
+
+        joes_game.make_move(((4, 1), (2, 3)))
+        self.assertIs(joes_game.get_checker_details((3, 2)), None)
+        self.assertEqual(joes_game.get_checker_details((2, 3)), "Black")
+        self.assertEqual(joes_game.get_black_turn(), 3)
+
+        joes_game.unmake_move()
+        self.assertEqual(joes_game.get_board(), board_before)
+        self.assertEqual(joes_game.get_black_turn(), 2)
+        self.assertEqual(bob.get_captured_pieces_count(), 0)
+
+
+class TestPositionHash(unittest.TestCase):
+    """Test the position hash"""
+
+    def test_1(self):
+        """Test that the same position reached by play_game and by make_move has the same hash, and that taking the
+            move back restores the old hash"""
+        joes_game = Checkers()
+        bobs_game = Checkers()
+
+        joe = joes_game.create_player("Joe", "White")
+        bob = joes_game.create_player("Bob", "Black")
+        starting_hash = bobs_game.position_hash()
+
+        joes_game.play_game("Bob", (5, 0), (4, 1))
+        bobs_game.make_move(((5, 0), (4, 1)))
+        self.assertEqual(joes_game.position_hash(), bobs_game.position_hash())
+        self.assertNotEqual(bobs_game.position_hash(), starting_hash)
+
+        bobs_game.unmake_move()
+        self.assertEqual(bobs_game.position_hash(), starting_hash)
+
+
+class TestComputerPlayer(unittest.TestCase):
+    """Test the computer player's search"""
+
+    def test_1(self):
+        """Test that the search takes a forced capture and leaves the game as it found it"""
+        joes_game = Checkers()
+
+        joe = joes_game.create_player("Joe", "White")
+        bob = joes_game.create_player("Bob", "Black")
+
+        joes_game.play_game("Bob", (5, 0), (4, 1))
+        joes_game.play_game("Joe", (2, 1), (3, 2))
+        joes_game.play_game("Bob", (5, 6), (4, 5))
+        joes_game.play_game("Joe", (2, 3), (3, 4))
+        bitboards_before = joes_game.get_bitboards()
+
+        result = best_move(joes_game, 50)
+        self.assertIn(result.get_move(), [((4, 1), (2, 3)), ((4, 5), (2, 3))])
+        self.assertEqual(joes_game.get_bitboards(), bitboards_before)
+
+    def test_2(self):
+        """Test that the parallel search reports every worker, finds a move for the side to move, and can search
+            again with the same workers"""
+        joes_game = Checkers()
+
+        with ParallelSearcher(workers=2) as searcher:
+            result = searcher.search(joes_game, 100)
+            self.assertIn(result.get_move(), list(joes_game.legal_moves("Black")))
+            self.assertEqual(result.get_workers(), 2)
+            self.assertEqual(len(result.get_worker_nodes_per_second()), 2)
+            self.assertEqual(joes_game.get_board(), CheckersBoard().get_game_board())
+
+            joes_game.make_move(result.get_move())
+            result = searcher.search(joes_game, 100)
+            self.assertIn(result.get_move(), list(joes_game.legal_moves("White")))
+
+        result = parallel_best_move(joes_game, 100, workers=2)
+        self.assertIn(result.get_move(), list(joes_game.legal_moves("White")))
+
+
+class TestTranspositionTable(unittest.TestCase):
+    """Test the transposition table"""
+
+    def test_1(self):
+        """Test that stored results are found again and that the table stays within its memory cap"""
+        table = TranspositionTable(1)
+
+        table.store(12345, 4, -30, EXACT, 2)
+        self.assertEqual(table.lookup(12345), (4, -30, EXACT, 2))
+        self.assertIs(table.lookup(54321), None)
+        self.assertEqual(table.get_hits(), 1)
+        self.assertEqual(table.get_misses(), 1)
+        self.assertLessEqual(table.get_size() * 16, 1024 * 1024)
+
+    def test_2(self):
+        """Test that two tables laid over the same buffer see each other's results"""
+        buffer = bytearray(transposition_table_bytes(1))
+        first_table = TranspositionTable(buffer=buffer)
+        second_table = TranspositionTable(buffer=buffer)
+
+        first_table.store(12345, 4, -30, EXACT, 2)
+        self.assertEqual(second_table.lookup(12345), (4, -30, EXACT, 2))
+
+
+class TestSimulator(unittest.TestCase):
+    """Test the batch game simulator"""
+
+    def test_1(self):
+        """Test that the same seed plays the same games, and that each result agrees with replaying its moves"""
+        def game_number(result):
+            return result.get_game_number()
+
+        results = sorted(simulate_games(6, workers=1, seed=3, max_moves=60), key=game_number)
+        replayed = sorted(simulate_games(6, workers=1, seed=3, max_moves=60), key=game_number)
+        self.assertEqual([game_number(result) for result in results], list(range(6)))
+        self.assertEqual([result.get_moves() for result in results], [result.get_moves() for result in replayed])
+        self.assertEqual([result.get_winner() for result in results], [result.get_winner() for result in replayed])
+
+        for result in results:
+            joes_game = Checkers()
+            black = joes_game.create_player("Black", "Black")
+            white = joes_game.create_player("White", "White")
+            color = "Black"
+            for move in result.get_moves():
+                for index in range(1, len(move)):
+                    joes_game.play_game(color, move[index - 1], move[index])
+                color = "White" if color == "Black" else "Black"
+
+            self.assertEqual((joes_game.get_black_turn(), joes_game.get_white_turn()),
+                             (result.get_black_turns(), result.get_white_turns()))
+            self.assertEqual((black.get_captured_pieces_count(), white.get_captured_pieces_count()),
+                             (result.get_black_captures(), result.get_white_captures()))
+
+
+class TestBatchEvaluator(unittest.TestCase):
+    """Test the NumPy batch evaluator against the per-board counts"""
+
+    def test_1(self):
+        """Test that counts, scores and mobility match Player, evaluate and legal_moves for every position"""
+        games = []
+        for result in simulate_games(4, workers=1, seed=11, max_moves=120):
+            joes_game = Checkers()
+            joes_game.create_player("Black", "Black")
+            joes_game.create_player("White", "White")
+            for move in result.get_moves():
+                joes_game.make_move(move)
+                games.append(joes_game.fork())
+        # Kings and triple kings of both colors, with jumps available for both sides
+        kings_game = Checkers()
+        kings_game.create_player("Black", "Black")
+        kings_game.create_player("White", "White")
+        kings_game.set_bitboards(1 << 13 | 1 << 25 | 1 << 30, 1 << 9 | 1 << 17 | 1 << 2, 1 << 13 | 1 << 17,
+                                 1 << 25 | 1 << 2)
+        games.append(kings_game)
+
+        positions = pack_positions(games)
+        features = batch_features(positions)
+        scores = batch_evaluate(positions)
+        self.assertEqual(len(scores), len(games))
+        for index, game in enumerate(games):
+            black, white = game.get_players()
+            for player, color in ((black, "black"), (white, "white")):
+                self.assertEqual(features[color + "_kings"][index], player.get_king_count())
+                self.assertEqual(features[color + "_triple_kings"][index], player.get_triple_king_count())
+                self.assertEqual(features[color + "_captured"][index], player.get_captured_pieces_count())
+                first_hops = {move[:2] for move in game.legal_moves(player.get_checker_color())}
+                self.assertEqual(features[color + "_mobility"][index], len(first_hops))
+            self.assertEqual(scores[index], evaluate(game, "Black"))
+
+
+class TestEvaluationCache(unittest.TestCase):
+    """Test the evaluation cache"""
+
+    def test_1(self):
+        """Test that repeated positions skip the evaluator and that the least recently used position is dropped"""
+        evaluated = []
+        cache = EvaluationCache(lambda game: evaluated.append(game.position_hash()) or len(evaluated), capacity=2)
+        joes_game = Checkers()
+
+        self.assertEqual(cache.evaluate(joes_game), 1)
+        self.assertEqual(cache.evaluate(Checkers()), 1)
+        joes_game.make_move(((5, 0), (4, 1)))
+        self.assertEqual(cache.evaluate(joes_game), 2)
+        joes_game.unmake_move()
+        self.assertEqual(cache.evaluate(joes_game), 1)
+        self.assertEqual((cache.get_hits(), cache.get_misses()), (2, 2))
+
+        # The position after (5, 0) to (4, 1) is now the least recently used, so a third position pushes it out
+        joes_game.make_move(((5, 2), (4, 3)))
+        cache.evaluate(joes_game)
+        joes_game.unmake_move()
+        joes_game.make_move(((5, 0), (4, 1)))
+        self.assertEqual(cache.evaluate(joes_game), 4)
+        self.assertEqual(cache.get_size(), 2)
+
+
+class TestGameServer(unittest.TestCase):
+    """Test the game server's request handling"""
+
+    def test_1(self):
+        """Test that moves are played by game ID and that game exceptions come back as error replies"""
+        server = GameServer()
+
+        game_id = server.handle_request({"op": "create_game"})["game_id"]
+        server.handle_request({"op": "create_player", "game_id": game_id, "player_name": "Joe", "piece_color": "White"})
+        server.handle_request({"op": "create_player", "game_id": game_id, "player_name": "Bob", "piece_color": "Black"})
+
+        reply = server.handle_request({"op": "play_game", "game_id": game_id, "player_name": "Joe",
+                                       "from": [2, 1], "to": [3, 2]})
+        self.assertEqual(reply["error"], "OutofTurn")
+
+        reply = server.handle_request({"op": "play_game", "game_id": game_id, "player_name": "Bob",
+                                       "from": [5, 0], "to": [4, 1]})
+        self.assertTrue(reply["ok"])
+        self.assertEqual(server.get_game(game_id).get_checker_details((4, 1)), "Black")
+
+    def test_2(self):
+        """Test that a line too long for the stream gets a BadRequest reply and the connection is closed"""
+        server = GameServer()
+
+        async def send_long_line(path):
+            listener = await asyncio.start_unix_server(server.handle_connection, path=path)
+            async with listener:
+                reader, writer = await asyncio.open_unix_connection(path)
+                writer.write(b"x" * (1 << 17) + b"\n")
+                await writer.drain()
+                reply = json.loads(await reader.readline())
+                rest = await reader.read()
+                writer.close()
+                return reply, rest
+
+        with tempfile.TemporaryDirectory() as directory:
+            reply, rest = asyncio.run(send_long_line(os.path.join(directory, "server.sock")))
+        self.assertEqual(reply["error"], "BadRequest")
+        self.assertEqual(rest, b"")
+
+    def test_3(self):
+        """Test that JSON nested too deeply to decode gets a BadRequest reply and the connection stays open"""
+        server = GameServer()
+
+        async def send_lines(path):
+            listener = await asyncio.start_unix_server(server.handle_connection, path=path)
+            async with listener:
+                reader, writer = await asyncio.open_unix_connection(path)
+                writer.write(b"[" * 50000 + b"\n" + b'{"op": "create_game"}\n')
+                await writer.drain()
+                replies = [json.loads(await reader.readline()) for request in range(2)]
+                writer.close()
+                return replies
+
+        with tempfile.TemporaryDirectory() as directory:
+            nested_reply, reply = asyncio.run(send_lines(os.path.join(directory, "server.sock")))
+        self.assertEqual(nested_reply["error"], "BadRequest")
+        self.assertTrue(reply["ok"])
+
+    def test_4(self):
+        """Test that a second player can't take the first player's name, and that moves wait for both players"""
+        server = GameServer()
+
+        game_id = server.handle_request({"op": "create_game"})["game_id"]
+        server.handle_request({"op": "create_player", "game_id": game_id, "player_name": "Joe", "piece_color": "White"})
+        reply = server.handle_request({"op": "play_game", "game_id": game_id, "player_name": "Joe",
+                                       "from": [2, 1], "to": [3, 2]})
+        self.assertEqual(reply["error"], "GameNotReady")
+
+        reply = server.handle_request({"op": "create_player", "game_id": game_id, "player_name": "Joe",
+                                       "piece_color": "Black"})
+        self.assertEqual(reply["error"], "BadRequest")
+        self.assertIsNone(server.get_game(game_id).get_players()[1])
+
+
+class TestGameRecords(unittest.TestCase):
+    """Test writing and reading game records"""
+
+    def test_1(self):
+        """Test that a recorded game reads back with the same players and moves, and replays to the same board"""
+        joes_game = Checkers()
+
+        joe = joes_game.create_player("Joe", "White")
+        bob = joes_game.create_player("Bob", "Black")
+
+        archive = io.BytesIO()
+        writer = GameRecordWriter(archive)
+        writer.attach(joes_game)
+        joes_game.play_game("Bob", (5, 0), (4, 1))
+        joes_game.play_game("Joe", (2, 1), (3, 2))
+        writer.finish(joes_game)
+        self.assertEqual(len(archive.getvalue()), 4 + 2 * 5 + 2 * 2 + 2)
+
+        archive.seek(0)
+        records = list(read_games(archive))
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].get_players(), [("Joe", "White"), ("Bob", "Black")])
+        self.assertEqual(records[0].get_move_locations(), [((5, 0), (4, 1)), ((2, 1), (3, 2))])
+        for replayed_game in records[0].replay():
+            pass
+        self.assertEqual(replayed_game.get_board(), joes_game.get_board())
+
+    def test_2(self):
+        """Test that a corrupt piece color or move is reported as a ValueError like any other damage to the file"""
+        archive = io.BytesIO()
+        GameRecordWriter(archive).write_game([("Joe", "White"), ("Bob", "Black")], [((5, 0), (4, 1))])
+        # The color byte follows the 4 byte file header, the name's length byte and the 3 bytes of "Joe", and the move
+        #   is the two bytes before the end of the game
+        for index, value in ((8, 7), (-3, 0x84)):
+            damaged = bytearray(archive.getvalue())
+            damaged[index] = value
+            with self.assertRaises(ValueError):
+                list(read_games(io.BytesIO(bytes(damaged))))
+
+
+class TestPositionDB(unittest.TestCase):
+    """Test the memory-mapped position store"""
+
+    def test_1(self):
+        """Test that stored positions are found with their score and move, and other positions are not found"""
+        joes_game = Checkers()
+        starting_hash = joes_game.position_hash()
+        joes_game.make_move(((5, 0), (4, 1)))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "book.ckpd")
+            write_position_db(path, [(starting_hash, pack_value(25, ((5, 0), (4, 1)))),
+                                     (joes_game.position_hash(), pack_value(-40))])
+
+            with PositionDB(path) as position_db:
+                self.assertEqual(len(position_db), 2)
+                self.assertEqual(unpack_score(position_db.lookup(starting_hash)), 25)
+                self.assertEqual(find_move(Checkers(), position_db.lookup(starting_hash)), ((5, 0), (4, 1)))
+                self.assertEqual(unpack_score(position_db.lookup_game(joes_game)), -40)
+                self.assertIsNone(find_move(joes_game, position_db.lookup_game(joes_game)))
+                self.assertIsNone(position_db.lookup(starting_hash ^ 1))
+
+    def test_2(self):
+        """Test that a store file cut short of the entries its header counts is refused when it is opened"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "book.ckpd")
+            write_position_db(path, [(1, pack_value(10)), (2, pack_value(-10))])
+            with open(path, "r+b") as file:
+                file.truncate(os.path.getsize(path) - 4)
+
+            with self.assertRaises(ValueError):
+                PositionDB(path)
+
+
+class TestTablebase(unittest.TestCase):
+    """Test the endgame tablebase"""
+
+    def test_1(self):
+        """Test one piece against one piece, where a king that can take the last enemy piece wins in 1"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "endgames.cktb")
+            # Every slot but the 48 where the black and white men would share a square
+            self.assertEqual(generate_tablebase(path, max_pieces=1, workers=1), 16400)
+
+            joes_game = Checkers()
+            # Black king on (3, 0) at the edge of the board, white man on (2, 1) with (1, 2) empty behind it
+            joes_game.set_bitboards(1 << 12, 1 << 8, 1 << 12, 0)
+            with Tablebase(path) as tablebase:
+                self.assertEqual(len(tablebase.get_signatures()), 9)
+                self.assertEqual(tablebase.probe(joes_game), ("Win", 1))
+                # White to move in the same position gets away
+                joes_game.set_bitboards(1 << 12, 1 << 8, 1 << 12, 0, black_to_move=False)
+                self.assertNotEqual(tablebase.probe(joes_game)[0], "Win")
+                self.assertIsNone(tablebase.probe(Checkers()))
+
+
+class TestBenchmarks(unittest.TestCase):
+    """Test the benchmark suite"""
+
+    def test_1(self):
+        """Test that a run times every path and only flags results that got slower than the baseline"""
+        results = run_benchmarks(game_count=2, rounds=1, repeat=2)
+        self.assertGreater(results["play_game"]["piece_move"]["calls"], 0)
+        self.assertGreater(results["replay"]["games_per_second"], 0)
+        self.assertEqual(compare_results(results, results), [])
+
+        baseline = {"play_game": {"piece_move": {"median_ns": 1.0}}, "queries": {}, "replay": {}}
+        self.assertEqual([name for name, old_value, value in compare_results(baseline, results)],
+                         ["play_game.piece_move"])
+
+
+class TestPerft(unittest.TestCase):
+    """Test perft counts from the starting board"""
+
+    def test_1(self):
+        """Test the counts against the known values for checkers, which triple kings can't change this shallow"""
+        joes_game = Checkers()
+        self.assertEqual([perft(joes_game, depth) for depth in range(1, 6)], [7, 49, 302, 1469, 7361])
+        self.assertEqual(joes_game.get_board(), CheckersBoard().get_game_board())
+
+        counts = divide(joes_game, 3)
+        self.assertEqual(len(counts), 7)
+        self.assertEqual(sum(count for move, count in counts), 302)
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test the play_game instrumentation"""
+
+    def test_1(self):
+        """Test that played moves, phases and exceptions are all reported to the sink"""
+        joes_game = Checkers()
+        sink = HistogramSink()
+        joes_game.set_instrumentation(sink)
+
+        joe = joes_game.create_player("Joe", "White")
+        bob = joes_game.create_player("Bob", "Black")
+        joes_game.play_game("Bob", (5, 0), (4, 1))
+        with self.assertRaises(OutofTurn):
+            joes_game.play_game("Bob", (5, 2), (4, 3))
+
+        self.assertEqual(sink.get_moves_processed(), 1)
+        self.assertEqual(sink.get_exception_counts(), {"OutofTurn": 1})
+        self.assertEqual(sink.get_phase_summary("piece_move")["calls"], 1)
+        self.assertEqual(sink.get_phase_summary("validate_turn")["calls"], 2)
+        self.assertEqual(sink.get_phase_summary("in_bounds")["calls"], 2)
+
+        joes_game.set_instrumentation(None)
+        joes_game.play_game("Joe", (2, 1), (3, 2))
+        self.assertEqual(sink.get_moves_processed(), 1)
+
+
+class TestGameValidator(unittest.TestCase):
+    """Test validating archived games in bulk"""
+
+    def test_1(self):
+        """Test that legal games pass and an illegal game fails at its first illegal move"""
+        archive = io.BytesIO()
+        writer = GameRecordWriter(archive)
+        players = [("Joe", "White"), ("Bob", "Black")]
+        writer.write_game(players, [((5, 0), (4, 1)), ((2, 1), (3, 2))])
+        writer.write_game(players, [((5, 0), (4, 1)), ((5, 2), (4, 3)), ((2, 1), (3, 2))])
+        writer.write_game(players, [])
+
+        archive.seek(0)
+        results = list(validate_games(read_games(archive), workers=1))
+        self.assertEqual([result.get_passed() for result in results], [True, False, True])
+        self.assertEqual(results[1].get_first_illegal_move(), (1, (21, 17), "InvalidSquare"))
+        self.assertIsNone(results[0].get_first_illegal_move())
+
+    def test_2(self):
+        """Test that a game naming a square that doesn't exist fails on its own without stopping the run"""
+        players = [("Joe", "White"), ("Bob", "Black")]
+        games = [GameRecord(players, [(20, 16)]), GameRecord(players, [(20, 16), (8, 1040)]),
+                 GameRecord(players, [(20, 16), (9, 13)])]
+        results = list(validate_games(games, workers=1))
+        self.assertEqual([result.get_passed() for result in results], [True, False, True])
+        self.assertEqual(results[1].get_first_illegal_move(), (1, (8, 1040), "InvalidSquare"))
+
+    def test_3(self):
+        """Test that try_play_game returns the exception play_game would raise and leaves the game alone"""
+        joes_game = Checkers()
+
+        joe = joes_game.create_player("Joe", "White")
+        bob = joes_game.create_player("Bob", "Black")
+        self.assertIs(joes_game.try_play_game("Joe", (2, 1), (3, 2)), OutofTurn)
+        self.assertEqual(joes_game.get_board(), CheckersBoard().get_game_board())
+        self.assertIsNone(joes_game.try_play_game("Bob", (5, 0), (4, 1)))
+        self.assertEqual(joes_game.get_black_turn(), 1)
+
+
+class TestSnapshots(unittest.TestCase):
+    """Test saving and restoring games as bytes"""
+
+    def test_1(self):
+        """Test that a restored game has the same board, players and counters and carries on from where it was"""
+        joes_game = Checkers()
+
+        joe = joes_game.create_player("Joe", "White")
+        bob = joes_game.create_player("Bob", "Black")
+        joes_game.play_game("Bob", (5, 0), (4, 1))
+        joes_game.play_game("Joe", (2, 1), (3, 2))
+        joes_game.play_game("Bob", (5, 6), (4, 5))
+        joes_game.play_game("Joe", (2, 3), (3, 4))
+        joes_game.play_game("Bob", (4, 1), (2, 3))
+
+        snapshot = joes_game.to_bytes()
+        self.assertEqual(len(snapshot), 64)
+        restored_game = Checkers.from_bytes(snapshot)
+        self.assertEqual(restored_game.get_board(), joes_game.get_board())
+        self.assertEqual(restored_game.position_hash(), joes_game.position_hash())
+        self.assertEqual((restored_game.get_black_turn(), restored_game.get_white_turn()), (3, 2))
+        restored_joe, restored_bob = restored_game.get_players()
+        self.assertEqual((restored_joe.get_player_name(), restored_joe.get_checker_color()), ("Joe", "White"))
+        self.assertEqual(restored_bob.get_captured_pieces_count(), 1)
+
+        restored_game.play_game("Joe", (1, 2), (2, 1))
+        self.assertEqual(restored_game.get_white_turn(), 3)
+
+    def test_2(self):
+        """Test that names too long for a snapshot are turned down"""
+        joes_game = Checkers()
+        joes_game.create_player("Joe with a very long name", "White")
+        with self.assertRaises(ValueError):
+            joes_game.to_bytes()
+
+
+class TestFork(unittest.TestCase):
+    """Test forking a game into separate variations"""
+
+    def test_1(self):
+        """Test that a fork shares the board until it moves, leaves the original alone, and can take back moves from
+            before the fork"""
+        joes_game = Checkers()
+        joes_game.create_player("Bob", "Black")
+        joes_game.make_move(next(joes_game.legal_moves("Black")))
+        board = [list(row) for row in joes_game.get_board()]
+        bitboards = joes_game.get_bitboards()
+        position_hash = joes_game.position_hash()
+
+        forked_game = joes_game.fork()
+        self.assertIs(forked_game.get_bitboards()[0], joes_game.get_bitboards()[0])
+        self.assertEqual(forked_game.get_players()[0].get_player_name(), "Bob")
+
+        forked_game.make_move(next(forked_game.legal_moves("White")))
+        self.assertNotEqual(forked_game.get_board(), board)
+        self.assertEqual(joes_game.get_board(), board)
+        self.assertEqual(joes_game.get_bitboards(), bitboards)
+        self.assertEqual(joes_game.position_hash(), position_hash)
+        self.assertEqual(joes_game.get_white_turn(), 0)
+
+        forked_game.unmake_move()
+        forked_game.unmake_move()
+        self.assertEqual(forked_game.get_board(), Checkers().get_board())
+        self.assertEqual(joes_game.get_board(), board)
+        self.assertEqual(joes_game.get_bitboards(), bitboards)
+        joes_game.unmake_move()
+        self.assertEqual(joes_game.position_hash(), forked_game.position_hash())
+
+
+class TestMoveChecks(unittest.TestCase):
+    """Test that moves a piece can't make are turned down before anything changes"""
+
+    def test_1(self):
+        """Test that long moves, backward moves by men, jumps over nothing and malformed squares are invalid"""
+        joes_game = Checkers()
+
+        joe = joes_game.create_player("Joe", "White")
+        bob = joes_game.create_player("Bob", "Black")
+        for start, destination in (((5, 0), (3, 0)), ((5, 0), (3, 2)), ((5, 2), (6, 1)), ((5, 2), (9, 9)),
+                                   ((5, 2), (4,)), ((8, 1), (4, 1))):
+            with self.assertRaises(InvalidSquare):
+                joes_game.play_game("Bob", start, destination)
+        self.assertEqual(joes_game.get_board(), CheckersBoard().get_game_board())
+        self.assertEqual(joes_game.get_black_turn(), 0)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,152 @@
+# Author: agent
+# GitHub username: agent
+# Date: 10/18/2026
+# Description: Checks archived games against the current rules in bulk. Every game in a game record file (see
+#   checkers_records) is replayed through Checkers.try_play_game, which turns illegal moves down without raising
+#   exceptions, and each game either passes or fails at its first illegal move. Games are handed to worker processes
+#   in chunks, and results come back in game order so they can be written out as a per-game summary.
+
+import argparse
+import collections
+import concurrent.futures
+import os
+import sys
+import time
+
+from checkers_game import Checkers
+from checkers_game import square_location
+from checkers_records import read_games
+
+
+DEFAULT_CHUNK_SIZE = 256
+
+
+class ValidationResult:
+    """Whether one archived game still follows the rules"""
+
+    def __init__(self, game_number, failure):
+        self._game_number = game_number
+        self._failure = failure
+
+    def get_game_number(self):
+        """Get which game in the file this was, counting from 0"""
+        return self._game_number
+
+    def get_passed(self):
+        """Get whether every move in the game was legal"""
+        return self._failure is None
+
+    def get_first_illegal_move(self):
+        """Get (move number, (start square number, destination square number), error name) for the first move that
+            was turned down, counting moves from 0, or None if the game passed"""
+        return self._failure
+
+
+def validate_game(players, moves):
+    """Replays one game from its players (a list of (player name, piece color)) and moves (a list of (start square
+        number, destination square number)). Returns None if every move is legal, otherwise (move number, move, error
+        name) for the first one that isn't."""
+    game = Checkers()
+    names = {}
+    for player_name, piece_color in players:
+        game.create_player(player_name, piece_color)
+        names[piece_color] = player_name
+    black_name, white_name = names.get("Black"), names.get("White")
+
+    play = game.try_play_game
+    for move_number, move in enumerate(moves):
+        # A damaged move can name a square that doesn't exist, which only fails this game
+        if not (0 <= move[0] < 32 and 0 <= move[1] < 32):
+            return move_number, move, "InvalidSquare"
+        # The records don't say who made each move, so it is whoever's turn it is
+        player_name = black_name if game.get_black_turn() <= game.get_white_turn() else white_name
+        error = play(player_name, square_location(move[0]), square_location(move[1]))
+        if error is not None:
+            return move_number, move, error.__name__
+    return None
+
+
+def _validate_chunk(first_game_number, games):
+    """Worker side: validates a run of consecutive games and returns their results as (game number, failure)"""
+    return [(first_game_number + index, validate_game(players, moves)) for index, (players, moves) in enumerate(games)]
+
+
+def _chunks(games, chunk_size):
+    """Groups games (GameRecord objects) into (first game number, list of (players, moves)), which are cheap to send
+        to a worker"""
+    chunk = []
+    first_game_number = 0
+    for record in games:
+        chunk.append((record.get_players(), record.get_moves()))
+        if len(chunk) == chunk_size:
+            yield first_game_number, chunk
+            first_game_number += chunk_size
+            chunk = []
+    if chunk:
+        yield first_game_number, chunk
+
+
+def validate_games(games, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Generator that validates games (an iterable of GameRecord, such as read_games gives) across workers worker
+        processes (the number of CPUs by default; with 1 everything runs in this process) and yields a
+        ValidationResult for each, in game order. Only a few chunks per worker are read ahead, so any number of games
+        can be streamed through."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers == 1:
+        for first_game_number, chunk in _chunks(games, chunk_size):
+            for game_number, failure in _validate_chunk(first_game_number, chunk):
+                yield ValidationResult(game_number, failure)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = collections.deque()
+        for first_game_number, chunk in _chunks(games, chunk_size):
+            pending.append(executor.submit(_validate_chunk, first_game_number, chunk))
+            # Hand results back in order as soon as the oldest chunk is done, keeping a few chunks per worker queued
+            while pending and (len(pending) >= workers * 4 or pending[0].done()):
+                for game_number, failure in pending.popleft().result():
+                    yield ValidationResult(game_number, failure)
+        while pending:
+            for game_number, failure in pending.popleft().result():
+                yield ValidationResult(game_number, failure)
+
+
+def _describe_square(square):
+    """Returns the location of a square number for printing, or the number itself if there is no such square"""
+    return square_location(square) if 0 <= square < 32 else square
+
+
+def main():
+    """Validates a game record file from the command line, printing one line per game (or per failed game) and a
+        count at the end. Exits with status 1 if any game failed."""
+    parser = argparse.ArgumentParser(description="Check archived checkers games against the current rules")
+    parser.add_argument("path", help="a game record file")
+    parser.add_argument("--workers", type=int, help="worker processes (defaults to the number of CPUs)")
+    parser.add_argument("--failures-only", action="store_true", help="only print the games that fail")
+    arguments = parser.parse_args()
+
+    started = time.perf_counter()
+    games = passed = 0
+    with open(arguments.path, "rb") as file:
+        for result in validate_games(read_games(file), arguments.workers):
+            games += 1
+            if result.get_passed():
+                passed += 1
+                if not arguments.failures_only:
+                    print(f"game {result.get_game_number()}: pass")
+            else:
+                move_number, (start, destination), error = result.get_first_illegal_move()
+                print(f"game {result.get_game_number()}: fail at move {move_number} "
+                      f"{_describe_square(start)} -> {_describe_square(destination)}: {error}")
+
+    elapsed = time.perf_counter() - started
+    print(f"{passed} of {games} games passed in {elapsed:.2f}s ({games / elapsed if elapsed else 0:.0f} games/second)",
+          file=sys.stderr)
+    if passed != games:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()